@@ -12,12 +12,16 @@ Manages budget tracking with:
 """
 
 import sqlite3
+import uuid
 from dataclasses import dataclass
 from datetime import date, datetime
 from pathlib import Path
 
 DB_PATH = Path.home() / ".claudius" / "claudius.db"
 
+# Pass as db_path to keep usage in memory (e.g. for tests); nothing touches disk
+MEMORY_DB_PATH = Path(":memory:")
+
 SCHEMA = """
 CREATE TABLE IF NOT EXISTS usage (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -85,12 +89,45 @@ class BudgetTracker:
 
     def __init__(self, db_path: Path | None = None):
         self.db_path = db_path or DB_PATH
+        self._memory_uri: str | None = None
+        self._memory_anchor: sqlite3.Connection | None = None
+        self._closed = False
+        if self.db_path == MEMORY_DB_PATH:
+            # A plain ":memory:" database vanishes with its connection, so name a
+            # shared-cache one and hold a connection open for the tracker's lifetime
+            self._memory_uri = f"file:claudius-{uuid.uuid4().hex}?mode=memory&cache=shared"
+            self._memory_anchor = sqlite3.connect(self._memory_uri, uri=True)
         self._ensure_db()
 
+    def connect(self) -> sqlite3.Connection:
+        """Open a connection to the usage database."""
+        if self._closed:
+            raise sqlite3.ProgrammingError("Cannot use a closed BudgetTracker.")
+        if self._memory_uri is not None:
+            return sqlite3.connect(self._memory_uri, uri=True)
+        return sqlite3.connect(self.db_path)
+
+    def close(self) -> None:
+        """Release the in-memory database and refuse further queries.
+
+        On-disk trackers hold no open connection; their usage stays on disk.
+        """
+        self._closed = True
+        if self._memory_anchor is not None:
+            self._memory_anchor.close()
+            self._memory_anchor = None
+
+    def __enter__(self) -> "BudgetTracker":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
     def _ensure_db(self) -> None:
         """Ensure database exists with schema."""
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        with sqlite3.connect(self.db_path) as conn:
+        if self._memory_uri is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.connect() as conn:
             conn.executescript(SCHEMA)
 
     def record_usage(
@@ -103,7 +140,7 @@ class BudgetTracker:
         query_preview: str | None = None,
     ) -> None:
         """Record an API call."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.connect() as conn:
             conn.execute(
                 """
                 INSERT INTO usage (model, input_tokens, output_tokens, cost, routed_by, query_preview)
@@ -122,7 +159,7 @@ class BudgetTracker:
     def get_daily_spent(self, day: date | None = None) -> float:
         """Get total spent for a day."""
         day = day or date.today()
-        with sqlite3.connect(self.db_path) as conn:
+        with self.connect() as conn:
             result = conn.execute(
                 "SELECT COALESCE(SUM(cost), 0) FROM usage WHERE DATE(timestamp) = ?",
                 (day.isoformat(),),
@@ -135,7 +172,7 @@ class BudgetTracker:
         year = year or now.year
         month = month or now.month
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self.connect() as conn:
             result = conn.execute(
                 """
                 SELECT COALESCE(SUM(cost), 0) FROM usage
@@ -50,16 +50,21 @@ class ChatClient:
         self,
         proxy_url: str = "http://localhost:4000",
         api_key: str | None = None,
+        cache_classifications: bool = False,
     ):
         self.proxy_url = proxy_url
         self.api_key = api_key
         self.conversation: list[dict[str, str]] = []
-        self.router = SmartRouter()
+        self.router = SmartRouter(cache_classifications=cache_classifications)
 
     def clear_history(self) -> None:
         """Clear conversation history."""
         self.conversation = []
 
+    async def aclose(self) -> None:
+        """Close the router's pooled HTTP client."""
+        await self.router.aclose()
+
     async def send_message(
         self,
         message: str,
@@ -16,7 +16,6 @@ Processes slash commands in the REPL:
 """
 
 import os
-import sqlite3
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
@@ -126,7 +125,7 @@ class CommandHandler:
 
     def _get_recent_usage(self, limit: int = 10) -> list[tuple[str, str, int, int, float, str | None]]:
         """Get recent usage history from tracker."""
-        with sqlite3.connect(self.tracker.db_path) as conn:
+        with self.tracker.connect() as conn:
             result = conn.execute(
                 """
                 SELECT timestamp, model, input_tokens, output_tokens, cost, query_preview
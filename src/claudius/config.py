@@ -32,6 +32,7 @@ currency = "EUR"
 default = "haiku"
 escalate_to = ["sonnet", "opus"]
 auto_classify = true
+cache_classifications = false
 
 [routing.heuristics]
 short_message_words = 20
@@ -85,6 +86,7 @@ class RoutingConfig:
     default: str = "haiku"
     escalate_to: list[str] = field(default_factory=lambda: ["sonnet", "opus"])
     auto_classify: bool = True
+    cache_classifications: bool = False  # Reuse Haiku verdicts for repeated messages
 
 
 @dataclass
@@ -144,7 +146,7 @@ class Config:
         routing_fields = {
             k: v
             for k, v in data.get("routing", {}).items()
-            if k in ("default", "escalate_to", "auto_classify")
+            if k in ("default", "escalate_to", "auto_classify", "cache_classifications")
         }
         proxy_fields = {
             k: v for k, v in data.get("proxy", {}).items() if k in ("host", "port")
@@ -64,7 +64,11 @@ class ClaudiusREPL:
 
         # Build proxy URL from config
         proxy_url = f"http://{config.proxy.host}:{config.proxy.port}"
-        self.chat_client = ChatClient(proxy_url=proxy_url, api_key=api_key)
+        self.chat_client = ChatClient(
+            proxy_url=proxy_url,
+            api_key=api_key,
+            cache_classifications=config.routing.cache_classifications,
+        )
 
         self.command_handler = CommandHandler(tracker, config, self.console)
 
@@ -142,7 +146,14 @@ class ClaudiusREPL:
         return ConfirmationResult(action="cancel")
 
     async def run(self) -> None:
-        """Run the REPL loop."""
+        """Run the REPL loop, releasing the chat client's connections on exit."""
+        try:
+            await self._run_loop()
+        finally:
+            await self.chat_client.aclose()
+
+    async def _run_loop(self) -> None:
+        """Show the banner and budget, then handle input until the user exits."""
         # Show banner on startup
         self.console.print(render_banner())
 
@@ -10,24 +10,46 @@ Implements intelligent model routing:
 3. Model selection based on complexity
 """
 
+import hashlib
 from dataclasses import dataclass
+from typing import ClassVar
 
 import httpx
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RouteDecision:
-    """Result of routing decision."""
+    """Result of routing decision.
+
+    Frozen so a single instance can safely be returned for repeated decisions.
+    """
 
     model: str  # "haiku", "sonnet", "opus"
     reason: str  # "heuristic:short_message", "haiku:self_handle", etc.
     needs_classification: bool = False  # True if Haiku should classify
 
 
+# Shared decisions for the heuristic outcomes that don't depend on the message
+_SONNET_CODE_BLOCK = RouteDecision(model="sonnet", reason="heuristic:code_block")
+_HAIKU_SHORT_MESSAGE = RouteDecision(model="haiku", reason="heuristic:short_message")
+_NEEDS_CLASSIFICATION = RouteDecision(
+    model="haiku", reason="needs_classification", needs_classification=True
+)
+
+
+def _count_words_capped(text: str, cap: int) -> int:
+    """Count whitespace-separated words, stopping once the count exceeds ``cap``.
+
+    Returns the exact count up to ``cap`` and ``cap + 1`` for anything longer,
+    without splitting the rest of a long message into a list of words.
+    """
+    return len(text.split(maxsplit=cap))
+
+
 class SmartRouter:
     """Smart model router with heuristics and Haiku gatekeeper."""
 
-    OPUS_KEYWORDS = [
+    OPUS_KEYWORDS: ClassVar[tuple[str, ...]] = (
         "architect",
         "design",
         "complex",
@@ -36,41 +58,77 @@ class SmartRouter:
         "comprehensive",
         "strategy",
         "review thoroughly",
-    ]
+    )
     SHORT_MESSAGE_WORDS = 20
-
-    def __init__(self) -> None:
-        pass
+    CLASSIFICATION_CACHE_SIZE = 1024
+
+    def __init__(self, cache_classifications: bool = False) -> None:
+        # Created on first use and kept so classification calls share pooled connections
+        self._client: httpx.AsyncClient | None = None
+        # Haiku verdicts keyed on a digest of the normalized message, so prompts
+        # themselves are never retained; None when caching is off
+        self._classification_cache: dict[bytes, RouteDecision] | None = (
+            {} if cache_classifications else None
+        )
+        # Only the latest heuristic decision is kept, so past prompts aren't retained
+        self._last_classified: tuple[str, RouteDecision] | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=10.0,
+                limits=httpx.Limits(max_keepalive_connections=10),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client, if one was created."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     def classify(self, message: str) -> RouteDecision:
         """Classify message using FREE heuristics only.
 
+        The decision for the most recent message is remembered, since the REPL
+        and the chat client both classify the same input.
+
         Returns:
             RouteDecision with model recommendation or needs_classification=True
         """
-        words = message.split()
-        word_count = len(words)
-        message_lower = message.lower()
-
+        last = self._last_classified
+        if last is not None and last[0] == message:
+            return last[1]
+        decision = self._classify_uncached(message)
+        self._last_classified = (message, decision)
+        return decision
+
+    def reset_cache(self) -> None:
+        """Forget the remembered heuristic decision."""
+        self._last_classified = None
+
+    def _classify_uncached(self, message: str) -> RouteDecision:
+        """Apply the heuristic rules behind classify()."""
+        # Rules run cheapest first; each one short-circuits the rest.
         # Rule 1: Code blocks need at least Sonnet (check first for precedence)
         if "```" in message:
-            return RouteDecision(model="sonnet", reason="heuristic:code_block")
+            return _SONNET_CODE_BLOCK
 
         # Rule 2: Short messages go to Haiku
+        word_count = _count_words_capped(message, self.SHORT_MESSAGE_WORDS)
         if word_count < self.SHORT_MESSAGE_WORDS:
-            return RouteDecision(model="haiku", reason="heuristic:short_message")
+            return _HAIKU_SHORT_MESSAGE
 
-        # Rule 3: Opus keywords
+        # Rule 3: Opus keywords. Substring checks on a lowered copy run in C and
+        # beat both an IGNORECASE regex alternation and pure-Python matchers.
+        message_lower = message.lower()
         for keyword in self.OPUS_KEYWORDS:
             if keyword in message_lower:
-                return RouteDecision(
-                    model="opus", reason=f"heuristic:opus_keyword:{keyword}"
-                )
+                return RouteDecision(model="opus", reason=f"heuristic:opus_keyword:{keyword}")
 
         # Rule 4: Ambiguous - needs Haiku to classify
-        return RouteDecision(
-            model="haiku", reason="needs_classification", needs_classification=True
-        )
+        return _NEEDS_CLASSIFICATION
 
     async def classify_with_haiku(
         self, message: str, api_key: str
@@ -78,6 +136,9 @@ class SmartRouter:
         """Ask Haiku if it can handle this query.
 
         Makes a small API call to Haiku (~10 tokens output) to classify complexity.
+        With ``cache_classifications`` enabled, messages that differ only in case
+        or whitespace from an earlier one reuse its verdict without an API call.
+        The REPL turns this on through ``routing.cache_classifications``.
 
         Returns:
             RouteDecision with Haiku's recommendation
@@ -91,41 +152,55 @@ Query: {message[:500]}
 
 Answer (one word):"""
 
+        cache = self._classification_cache
+        cache_key = b""
+        if cache is not None:
+            normalized = " ".join(message.casefold().split())
+            cache_key = hashlib.sha256(normalized.encode()).digest()
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "https://api.anthropic.com/v1/messages",
-                    headers={
-                        "x-api-key": api_key,
-                        "anthropic-version": "2023-06-01",
-                        "content-type": "application/json",
-                    },
-                    json={
-                        "model": "claude-3-5-haiku-20241022",
-                        "max_tokens": 10,
-                        "messages": [
-                            {"role": "user", "content": classification_prompt}
-                        ],
-                    },
-                    timeout=10.0,
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    answer = data["content"][0]["text"].strip().upper()
-
-                    if "OPUS" in answer:
-                        return RouteDecision(
-                            model="opus", reason="haiku:classified_opus"
-                        )
-                    elif "SONNET" in answer:
-                        return RouteDecision(
-                            model="sonnet", reason="haiku:classified_sonnet"
-                        )
-                    else:
-                        return RouteDecision(
-                            model="haiku", reason="haiku:self_handle"
-                        )
+            client = self._get_client()
+            response = await client.post(
+                "https://api.anthropic.com/v1/messages",
+                headers={
+                    "x-api-key": api_key,
+                    "anthropic-version": "2023-06-01",
+                    "content-type": "application/json",
+                },
+                json={
+                    "model": "claude-3-5-haiku-20241022",
+                    "max_tokens": 10,
+                    "messages": [
+                        {"role": "user", "content": classification_prompt}
+                    ],
+                },
+            )
+
+            if response.status_code == 200:
+                data = response.json()
+                answer = data["content"][0]["text"].strip().upper()
+
+                if "OPUS" in answer:
+                    decision = RouteDecision(
+                        model="opus", reason="haiku:classified_opus"
+                    )
+                elif "SONNET" in answer:
+                    decision = RouteDecision(
+                        model="sonnet", reason="haiku:classified_sonnet"
+                    )
+                else:
+                    decision = RouteDecision(
+                        model="haiku", reason="haiku:self_handle"
+                    )
+
+                if cache is not None:
+                    if len(cache) >= self.CLASSIFICATION_CACHE_SIZE:
+                        del cache[next(iter(cache))]  # Evict the oldest entry
+                    cache[cache_key] = decision
+                return decision
 
         except Exception:
             pass  # Fall through to default
@@ -0,0 +1,99 @@
+# ABOUTME: Shared pytest fixtures for the Claudius test suite
+# ABOUTME: Provides session-wide REPL and router fixtures plus cheap per-test REPL copies
+
+"""Shared fixtures for Claudius tests."""
+
+import asyncio
+import copy
+import sys
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from claudius.budget import MEMORY_DB_PATH, BudgetTracker
+from claudius.config import Config
+from claudius.repl import ClaudiusREPL
+from claudius.router import SmartRouter
+from tests.helpers import BASE_CONFIG, scripted_prompt
+
+
+def pytest_asyncio_loop_factories(
+    config: pytest.Config, item: pytest.Item
+) -> dict[str, Callable[[], asyncio.AbstractEventLoop]]:
+    """Run async tests marked ``uvloop`` on uvloop where it is available.
+
+    Every other async test keeps the default asyncio loop.
+    """
+    if item.get_closest_marker("uvloop") is not None and sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            return {"uvloop": uvloop.new_event_loop}
+    return {"asyncio": asyncio.new_event_loop}
+
+
+@pytest.fixture(scope="session")
+def router() -> SmartRouter:
+    """One router for the session.
+
+    Its only state is the remembered latest heuristic decision, which is safe
+    to share because classify() is deterministic for a given message.
+    """
+    return SmartRouter()
+
+
+@pytest.fixture
+def memory_tracker() -> Iterator[BudgetTracker]:
+    """Budget tracker with its own in-memory database, closed after the test."""
+    with BudgetTracker(db_path=MEMORY_DB_PATH) as tracker:
+        yield tracker
+
+
+@pytest.fixture(scope="session")
+def _repl_template() -> Iterator[ClaudiusREPL]:
+    """Build one REPL per session; tests receive shallow copies of it."""
+    with BudgetTracker(db_path=MEMORY_DB_PATH) as tracker:
+        yield ClaudiusREPL(tracker=tracker, config=BASE_CONFIG, api_key="sk-ant-test123")
+
+
+@pytest.fixture
+def repl(_repl_template: ClaudiusREPL, memory_tracker: BudgetTracker) -> ClaudiusREPL:
+    """Create a REPL for testing with confirmation skipped.
+
+    The copy gets its own prompt session, budget tracker, chat client, router
+    and command handler so spending, conversation history, pooled HTTP clients
+    and model overrides never leak between tests.
+    """
+    r = copy.copy(_repl_template)
+    r.session = SimpleNamespace(prompt_async=scripted_prompt(EOFError))  # type: ignore[assignment]
+    r.tracker = memory_tracker
+    r.chat_client = copy.copy(_repl_template.chat_client)
+    r.chat_client.conversation = []
+    r.chat_client.router = SmartRouter()
+    r.command_handler = copy.copy(_repl_template.command_handler)
+    r.command_handler.tracker = r.tracker
+    r.command_handler.console = r.console
+    r.skip_confirmation = True  # Skip confirmation dialog in tests
+    return r
+
+
+@pytest.fixture
+def fresh_repl(tmp_path: Path) -> Callable[..., ClaudiusREPL]:
+    """Factory for REPLs built through the real constructor."""
+
+    def _make(
+        tracker: BudgetTracker | None = None,
+        config: Config | None = None,
+        api_key: str = "sk-ant-test123",
+    ) -> ClaudiusREPL:
+        return ClaudiusREPL(
+            tracker=tracker or BudgetTracker(db_path=tmp_path / "budget.db"),
+            config=config or BASE_CONFIG,
+            api_key=api_key,
+        )
+
+    return _make
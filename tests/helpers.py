@@ -0,0 +1,31 @@
+# ABOUTME: Plain helpers shared by the Claudius test modules
+# ABOUTME: Holds the shared default config and a scripted prompt_async stand-in
+
+"""Shared test helpers that aren't fixtures."""
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from claudius.config import Config
+
+# ClaudiusREPL never mutates its config, so read-only tests can share one instance
+BASE_CONFIG = Config()
+
+
+def scripted_prompt(*items: Any) -> Callable[..., Awaitable[Any]]:
+    """Build a ``prompt_async`` replacement that replays scripted input.
+
+    Each call returns the next item; exception classes or instances in the
+    script are raised instead, e.g. ``scripted_prompt("Hello", EOFError)``.
+    """
+    it = iter(items)
+
+    async def _prompt(*args: Any, **kwargs: Any) -> Any:
+        item = next(it)
+        if isinstance(item, BaseException) or (
+            isinstance(item, type) and issubclass(item, BaseException)
+        ):
+            raise item
+        return item
+
+    return _prompt
@@ -10,7 +10,7 @@ from pathlib import Path
 
 import pytest
 
-from claudius.budget import BudgetStatus, BudgetTracker
+from claudius.budget import MEMORY_DB_PATH, BudgetStatus, BudgetTracker
 
 
 @pytest.fixture
@@ -231,3 +231,42 @@ class TestDailyHardLimit:
     ) -> None:
         """Test that is_daily_hard_limit_exceeded returns False with no spending."""
         assert tracker.is_daily_hard_limit_exceeded(daily_hard=10.0) is False
+
+
+class TestInMemoryTracker:
+    """Tests for trackers backed by an in-memory database."""
+
+    def test_usage_persists_across_calls(self, memory_tracker: BudgetTracker) -> None:
+        """Test that recorded usage survives between separate queries."""
+        memory_tracker.record_usage(model="haiku", input_tokens=10, output_tokens=20, cost=1.5)
+
+        assert memory_tracker.get_daily_spent() == 1.5
+        assert memory_tracker.get_monthly_spent() == 1.5
+
+    def test_trackers_do_not_share_memory_database(self) -> None:
+        """Test that each in-memory tracker gets its own database."""
+        with (
+            BudgetTracker(db_path=MEMORY_DB_PATH) as first,
+            BudgetTracker(db_path=MEMORY_DB_PATH) as second,
+        ):
+            first.record_usage(model="haiku", input_tokens=10, output_tokens=20, cost=1.5)
+
+            assert second.get_daily_spent() == 0.0
+
+    def test_closed_tracker_refuses_queries(self) -> None:
+        """Test that an in-memory tracker can't be queried once closed."""
+        with BudgetTracker(db_path=MEMORY_DB_PATH) as tracker:
+            tracker.record_usage(model="haiku", input_tokens=10, output_tokens=20, cost=1.5)
+
+        with pytest.raises(sqlite3.ProgrammingError, match="closed BudgetTracker"):
+            tracker.get_daily_spent()
+
+    def test_closing_disk_tracker_keeps_usage_on_disk(self, tmp_path: Path) -> None:
+        """Test that closing an on-disk tracker refuses queries but keeps its data."""
+        db_path = tmp_path / "budget.db"
+        with BudgetTracker(db_path=db_path) as tracker:
+            tracker.record_usage(model="haiku", input_tokens=10, output_tokens=20, cost=1.5)
+
+        with pytest.raises(sqlite3.ProgrammingError, match="closed BudgetTracker"):
+            tracker.get_daily_spent()
+        assert BudgetTracker(db_path=db_path).get_daily_spent() == 1.5
@@ -79,6 +79,15 @@ class TestChatClientInit:
 
         assert client.conversation == []
 
+    async def test_aclose_closes_router_client(self) -> None:
+        """Test that aclose releases the router's HTTP client."""
+        client = ChatClient()
+        client.router.aclose = AsyncMock()
+
+        await client.aclose()
+
+        client.router.aclose.assert_awaited_once()
+
 
 class TestSendMessageBasic:
     """Tests for basic send_message functionality."""
@@ -964,6 +973,20 @@ class TestSmartRouting:
         assert hasattr(client, "router")
         assert isinstance(client.router, SmartRouter)
 
+    async def test_cache_classifications_reaches_router(self) -> None:
+        """ChatClient(cache_classifications=True) reuses Haiku verdicts."""
+        reply = MagicMock(status_code=200)
+        reply.json.return_value = {"content": [{"text": "SONNET"}]}
+        http_client = AsyncMock()
+        http_client.post.return_value = reply
+        client = ChatClient(api_key="sk-ant-test123", cache_classifications=True)
+
+        with patch("claudius.router.httpx.AsyncClient", return_value=http_client):
+            await client.router.classify_with_haiku("Explain this", "sk-ant-test123")
+            await client.router.classify_with_haiku("explain  this", "sk-ant-test123")
+
+        assert http_client.post.await_count == 1
+
     async def test_chat_response_has_routed_by_field(self) -> None:
         """ChatResponse should have routed_by field."""
         response = ChatResponse(
@@ -0,0 +1,27 @@
+# ABOUTME: Tests for loading the Claudius TOML configuration
+# ABOUTME: Verifies that config file keys reach the matching dataclass fields
+
+"""Tests for Claudius configuration loading."""
+
+from pathlib import Path
+
+from claudius.config import Config
+
+
+class TestRoutingConfigLoad:
+    """Tests for loading the [routing] section from TOML."""
+
+    def test_cache_classifications_defaults_off(self, tmp_path: Path) -> None:
+        """Test that a fresh default config leaves classification caching off."""
+        config = Config.load(tmp_path / "config.toml")
+
+        assert config.routing.cache_classifications is False
+
+    def test_cache_classifications_loads_from_toml(self, tmp_path: Path) -> None:
+        """Test that routing.cache_classifications is read from the config file."""
+        config_path = tmp_path / "config.toml"
+        config_path.write_text("[routing]\ncache_classifications = true\n")
+
+        config = Config.load(config_path)
+
+        assert config.routing.cache_classifications is True
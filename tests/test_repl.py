@@ -3,137 +3,184 @@
 
 """Tests for Claudius REPL."""
 
-import tempfile
+import io
+from collections.abc import Callable, Iterator
 from pathlib import Path
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from rich.console import Console
+from rich.text import Text
 
-from claudius.budget import BudgetTracker
+from claudius.budget import MEMORY_DB_PATH, BudgetTracker
 from claudius.chat import ChatResponse
 from claudius.config import Config
 from claudius.estimation import EstimationResult
 from claudius.repl import ClaudiusREPL
+from tests.helpers import BASE_CONFIG, scripted_prompt
 
+# The REPL tests do little but await mocks, so they run on the faster loop
+pytestmark = pytest.mark.uvloop
 
-class TestClaudiusREPLInit:
-    """Tests for ClaudiusREPL initialization."""
+MOCK_CHAT_RESPONSE = ChatResponse(
+    model="sonnet",
+    text="Hello! How can I help you?",
+    input_tokens=100,
+    output_tokens=50,
+    cost=0.005,
+)
 
-    @pytest.fixture
-    def temp_db(self) -> Path:
-        """Create a temporary database file."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-            return Path(f.name)
 
-    @pytest.fixture
-    def temp_history(self) -> Path:
-        """Create a temporary history file path."""
-        with tempfile.TemporaryDirectory() as d:
-            history_path = Path(d) / "history"
-            yield history_path
+def _find_needles(chunks: list[str], *needles: str) -> set[str]:
+    """Return the (lowercased) needles found in the captured output.
 
-    def test_repl_initializes_with_required_dependencies(self, temp_db: Path) -> None:
-        """Test that REPL initializes with tracker, config, and api_key."""
-        tracker = BudgetTracker(db_path=temp_db)
-        config = Config()
+    The output is joined and casefolded once, so each needle is a plain
+    substring check and may span consecutive print calls.
+    """
+    text = "\n".join(chunks).casefold()
+    return {needle.lower() for needle in needles if needle.casefold() in text}
 
-        repl = ClaudiusREPL(tracker=tracker, config=config, api_key="sk-ant-test123")
 
-        assert repl.tracker is tracker
-        assert repl.config is config
-        assert repl.console is not None
+def _assert_contains(chunks: list[str], *needles: str) -> None:
+    """Assert that every needle appears somewhere in the captured output."""
+    missing = {n.lower() for n in needles} - _find_needles(chunks, *needles)
+    assert not missing, f"Missing from output: {sorted(missing)}"
 
-    def test_repl_creates_console(self, temp_db: Path) -> None:
-        """Test that REPL creates a Rich console."""
-        tracker = BudgetTracker(db_path=temp_db)
-        config = Config()
 
-        repl = ClaudiusREPL(tracker=tracker, config=config, api_key="sk-ant-test123")
+class _CountingConsole:
+    """Stand-in for the REPL's Rich console that only counts print calls."""
 
-        assert isinstance(repl.console, Console)
+    def __init__(self) -> None:
+        self.prints = 0
 
-    def test_repl_creates_chat_client(self, temp_db: Path) -> None:
-        """Test that REPL creates a ChatClient with api_key."""
-        tracker = BudgetTracker(db_path=temp_db)
-        config = Config()
+    def print(self, *args: object, **kwargs: object) -> None:
+        self.prints += 1
 
-        repl = ClaudiusREPL(tracker=tracker, config=config, api_key="sk-ant-test123")
 
-        assert repl.chat_client is not None
-        assert repl.chat_client.api_key == "sk-ant-test123"
+class _RecordingConsole:
+    """Stand-in for the REPL's Rich console that records plain text.
 
-    def test_repl_creates_command_handler(self, temp_db: Path) -> None:
-        """Test that REPL creates a CommandHandler."""
-        tracker = BudgetTracker(db_path=temp_db)
-        config = Config()
+    Tests only grep printed output, so nothing is styled. ``Text`` is stored
+    as its plain string, markup strings with their tags stripped, and other
+    renderables (tables, panels, groups) are laid out without color first.
+    """
 
-        repl = ClaudiusREPL(tracker=tracker, config=config, api_key="sk-ant-test123")
+    def __init__(self) -> None:
+        self.out: list[str] = []
+        self._plain = Console(file=io.StringIO(), color_system=None, width=100)
 
-        assert repl.command_handler is not None
-        assert repl.command_handler.tracker is tracker
-        assert repl.command_handler.config is config
+    def print(self, renderable: object, *args: object, **kwargs: object) -> None:
+        if isinstance(renderable, Text):
+            self.out.append(renderable.plain)
+        elif isinstance(renderable, str):
+            self.out.append(Text.from_markup(renderable).plain)
+        else:
+            with self._plain.capture() as capture:
+                self._plain.print(renderable)
+            self.out.append(capture.get())
 
-    def test_repl_creates_prompt_session(self, temp_db: Path) -> None:
-        """Test that REPL creates a PromptSession."""
-        tracker = BudgetTracker(db_path=temp_db)
-        config = Config()
 
-        repl = ClaudiusREPL(tracker=tracker, config=config, api_key="sk-ant-test123")
+@pytest.fixture(scope="class")
+def init_tracker() -> Iterator[BudgetTracker]:
+    """Tracker handed to the class-wide REPL."""
+    with BudgetTracker(db_path=MEMORY_DB_PATH) as tracker:
+        yield tracker
+
+
+@pytest.fixture(scope="class")
+def init_config() -> Config:
+    """Config handed to the class-wide REPL."""
+    return BASE_CONFIG
+
+
+@pytest.fixture(scope="class")
+def init_repl(init_tracker: BudgetTracker, init_config: Config) -> ClaudiusREPL:
+    """Construct one REPL shared by the read-only init assertions."""
+    return ClaudiusREPL(tracker=init_tracker, config=init_config, api_key="sk-ant-test123")
+
+
+class TestClaudiusREPLInit:
+    """Tests for ClaudiusREPL initialization."""
 
-        assert repl.session is not None
+    def test_repl_initializes_with_required_dependencies(
+        self, init_repl: ClaudiusREPL, init_tracker: BudgetTracker, init_config: Config
+    ) -> None:
+        """Test that REPL initializes with tracker, config, and api_key."""
+        assert init_repl.tracker is init_tracker
+        assert init_repl.config is init_config
+        assert init_repl.console is not None
+
+    @pytest.mark.parametrize(
+        "check",
+        [
+            pytest.param(lambda r: isinstance(r.console, Console), id="console"),
+            pytest.param(lambda r: r.chat_client.api_key == "sk-ant-test123", id="chat_client"),
+            pytest.param(
+                lambda r: r.command_handler.tracker is r.tracker
+                and r.command_handler.config is r.config,
+                id="command_handler",
+            ),
+            pytest.param(lambda r: r.session is not None, id="session"),
+        ],
+    )
+    def test_repl_creates_component(
+        self, init_repl: ClaudiusREPL, check: Callable[[ClaudiusREPL], bool]
+    ) -> None:
+        """Test that REPL creates its console, chat client, command handler and session."""
+        assert check(init_repl)
 
-    def test_repl_uses_proxy_url_from_config(self, temp_db: Path) -> None:
+    def test_repl_uses_proxy_url_from_config(
+        self, fresh_repl: Callable[..., ClaudiusREPL]
+    ) -> None:
         """Test that REPL uses proxy URL from config."""
-        tracker = BudgetTracker(db_path=temp_db)
         config = Config()
         config.proxy.host = "127.0.0.1"
         config.proxy.port = 5000
 
-        repl = ClaudiusREPL(tracker=tracker, config=config, api_key="sk-ant-test123")
+        repl = fresh_repl(config=config)
 
         assert repl.chat_client.proxy_url == "http://127.0.0.1:5000"
 
+    @pytest.mark.parametrize("enabled", [True, False])
+    def test_repl_passes_classification_cache_setting(
+        self, fresh_repl: Callable[..., ClaudiusREPL], enabled: bool
+    ) -> None:
+        """Test that the routing config decides whether Haiku verdicts are cached."""
+        config = Config()
+        config.routing.cache_classifications = enabled
 
-class TestClaudiusREPLRun:
-    """Tests for ClaudiusREPL run method."""
+        with patch("claudius.repl.ChatClient") as mock_chat_client:
+            fresh_repl(config=config)
 
-    @pytest.fixture
-    def temp_db(self) -> Path:
-        """Create a temporary database file."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-            return Path(f.name)
+        assert mock_chat_client.call_args.kwargs["cache_classifications"] is enabled
 
-    @pytest.fixture
-    def repl(self, temp_db: Path) -> ClaudiusREPL:
-        """Create a REPL instance for testing."""
-        tracker = BudgetTracker(db_path=temp_db)
-        config = Config()
-        return ClaudiusREPL(tracker=tracker, config=config, api_key="sk-ant-test123")
+
+class TestClaudiusREPLRun:
+    """Tests for ClaudiusREPL run method."""
 
     async def test_run_shows_banner_on_startup(self, repl: ClaudiusREPL) -> None:
         """Test that run shows banner on startup."""
-        repl.session.prompt_async = AsyncMock(side_effect=EOFError)
+        repl.session.prompt_async = scripted_prompt(EOFError)
 
-        with patch.object(repl.console, "print") as mock_print:
-            await repl.run()
+        repl.console = _CountingConsole()
+        await repl.run()
 
-            # First print should be banner (contains CLAUDIUS)
-            assert mock_print.call_count >= 1
+        # First print should be banner (contains CLAUDIUS)
+        assert repl.console.prints >= 1
 
     async def test_run_shows_budget_bars_on_startup(self, repl: ClaudiusREPL) -> None:
         """Test that run shows budget bars on startup."""
-        repl.session.prompt_async = AsyncMock(side_effect=EOFError)
+        repl.session.prompt_async = scripted_prompt(EOFError)
 
-        with patch.object(repl.console, "print") as mock_print:
-            await repl.run()
+        repl.console = _CountingConsole()
+        await repl.run()
 
-            # Should have at least 2 prints (banner, budget bars)
-            assert mock_print.call_count >= 2
+        # Should have at least 2 prints (banner, budget bars)
+        assert repl.console.prints >= 2
 
     async def test_run_exits_on_eof(self, repl: ClaudiusREPL) -> None:
         """Test that run exits gracefully on EOFError (Ctrl+D)."""
-        repl.session.prompt_async = AsyncMock(side_effect=EOFError)
+        repl.session.prompt_async = scripted_prompt(EOFError)
 
         # Should not raise an exception
         await repl.run()
@@ -141,52 +188,59 @@ class TestClaudiusREPLRun:
     async def test_run_continues_on_keyboard_interrupt(self, repl: ClaudiusREPL) -> None:
         """Test that run continues on KeyboardInterrupt (Ctrl+C)."""
         # First call raises KeyboardInterrupt, second raises EOFError to exit
-        repl.session.prompt_async = AsyncMock(
-            side_effect=[KeyboardInterrupt, EOFError]
-        )
+        repl.session.prompt_async = scripted_prompt(KeyboardInterrupt, EOFError)
 
         # Should not raise an exception
         await repl.run()
 
     async def test_run_exits_on_quit_command(self, repl: ClaudiusREPL) -> None:
         """Test that run exits on /quit command."""
-        repl.session.prompt_async = AsyncMock(return_value="/quit")
+        repl.session.prompt_async = Mock(wraps=scripted_prompt("/quit"))
 
         await repl.run()
 
         # Verify prompt was called (to get /quit)
         repl.session.prompt_async.assert_called()
 
+    @pytest.mark.parametrize("exit_input", ["/quit", EOFError], ids=["quit", "eof"])
+    async def test_run_closes_chat_client_on_exit(
+        self, repl: ClaudiusREPL, exit_input: object
+    ) -> None:
+        """Test that leaving the loop closes the chat client's connections."""
+        repl.session.prompt_async = scripted_prompt(exit_input)
+        repl.chat_client.aclose = AsyncMock()
+
+        await repl.run()
 
-class TestClaudiusREPLCommandHandling:
-    """Tests for REPL command handling."""
+        repl.chat_client.aclose.assert_awaited_once()
 
-    @pytest.fixture
-    def temp_db(self) -> Path:
-        """Create a temporary database file."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-            return Path(f.name)
+    async def test_run_closes_chat_client_on_error(self, repl: ClaudiusREPL) -> None:
+        """Test that the chat client is closed even when the loop raises."""
+        repl.session.prompt_async = scripted_prompt(RuntimeError("boom"))
+        repl.chat_client.aclose = AsyncMock()
 
-    @pytest.fixture
-    def repl(self, temp_db: Path) -> ClaudiusREPL:
-        """Create a REPL instance for testing."""
-        tracker = BudgetTracker(db_path=temp_db)
-        config = Config()
-        return ClaudiusREPL(tracker=tracker, config=config, api_key="sk-ant-test123")
+        with pytest.raises(RuntimeError, match="boom"):
+            await repl.run()
+
+        repl.chat_client.aclose.assert_awaited_once()
+
+
+class TestClaudiusREPLCommandHandling:
+    """Tests for REPL command handling."""
 
     async def test_command_output_is_printed(self, repl: ClaudiusREPL) -> None:
         """Test that command output is printed to console."""
-        repl.session.prompt_async = AsyncMock(side_effect=["/help", "/quit"])
+        repl.session.prompt_async = scripted_prompt("/help", "/quit")
 
-        with patch.object(repl.console, "print") as mock_print:
-            await repl.run()
+        repl.console = _CountingConsole()
+        await repl.run()
 
-            # Should print banner, budget bars, and help output
-            assert mock_print.call_count >= 3
+        # Should print banner, budget bars, and help output
+        assert repl.console.prints >= 3
 
     async def test_model_override_command_sets_override(self, repl: ClaudiusREPL) -> None:
         """Test that model override commands set the override."""
-        repl.session.prompt_async = AsyncMock(side_effect=["/opus", "/quit"])
+        repl.session.prompt_async = scripted_prompt("/opus", "/quit")
 
         await repl.run()
 
@@ -197,32 +251,6 @@ class TestClaudiusREPLCommandHandling:
 class TestClaudiusREPLChatHandling:
     """Tests for REPL chat message handling."""
 
-    @pytest.fixture
-    def temp_db(self) -> Path:
-        """Create a temporary database file."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-            return Path(f.name)
-
-    @pytest.fixture
-    def repl(self, temp_db: Path) -> ClaudiusREPL:
-        """Create a REPL instance for testing with confirmation skipped."""
-        tracker = BudgetTracker(db_path=temp_db)
-        config = Config()
-        repl = ClaudiusREPL(tracker=tracker, config=config, api_key="sk-ant-test123")
-        repl.skip_confirmation = True  # Skip confirmation dialog in tests
-        return repl
-
-    @pytest.fixture
-    def mock_chat_response(self) -> ChatResponse:
-        """Create a mock chat response."""
-        return ChatResponse(
-            model="sonnet",
-            text="Hello! How can I help you?",
-            input_tokens=100,
-            output_tokens=50,
-            cost=0.005,
-        )
-
     @pytest.fixture
     def mock_estimation(self) -> EstimationResult:
         """Create a mock estimation result."""
@@ -239,11 +267,11 @@ class TestClaudiusREPLChatHandling:
         )
 
     async def test_chat_message_is_sent_to_client(
-        self, repl: ClaudiusREPL, mock_chat_response: ChatResponse, mock_estimation: EstimationResult
+        self, repl: ClaudiusREPL, mock_estimation: EstimationResult
     ) -> None:
         """Test that non-command messages are sent to chat client."""
-        repl.session.prompt_async = AsyncMock(side_effect=["Hello", "/quit"])
-        repl.chat_client.send_message = AsyncMock(return_value=mock_chat_response)
+        repl.session.prompt_async = scripted_prompt("Hello", "/quit")
+        repl.chat_client.send_message = AsyncMock(return_value=MOCK_CHAT_RESPONSE)
 
         with patch("claudius.repl.estimate_cost", new_callable=AsyncMock) as mock_estimate:
             mock_estimate.return_value = mock_estimation
@@ -252,43 +280,46 @@ class TestClaudiusREPLChatHandling:
         repl.chat_client.send_message.assert_called_once()
 
     async def test_chat_response_is_displayed(
-        self, repl: ClaudiusREPL, mock_chat_response: ChatResponse, mock_estimation: EstimationResult
+        self, repl: ClaudiusREPL, mock_estimation: EstimationResult
     ) -> None:
         """Test that chat response is displayed."""
-        repl.session.prompt_async = AsyncMock(side_effect=["Hello", "/quit"])
-        repl.chat_client.send_message = AsyncMock(return_value=mock_chat_response)
+        repl.session.prompt_async = scripted_prompt("Hello", "/quit")
+        repl.chat_client.send_message = AsyncMock(return_value=MOCK_CHAT_RESPONSE)
 
         with patch("claudius.repl.estimate_cost", new_callable=AsyncMock) as mock_estimate:
             mock_estimate.return_value = mock_estimation
-            with patch.object(repl.console, "print") as mock_print:
-                await repl.run()
+            repl.console = _CountingConsole()
+            await repl.run()
 
-                # Should print banner, budget bars, cost estimate, response, and cost line
-                assert mock_print.call_count >= 5
+            # Should print banner, budget bars, cost estimate, response, and cost line
+            assert repl.console.prints >= 5
 
     async def test_model_override_is_passed_to_chat_client(
-        self, repl: ClaudiusREPL, mock_chat_response: ChatResponse, mock_estimation: EstimationResult
+        self, repl: ClaudiusREPL, mock_estimation: EstimationResult
     ) -> None:
         """Test that model override is passed to chat client."""
-        repl.session.prompt_async = AsyncMock(side_effect=["/opus", "Hello", "/quit"])
-        repl.chat_client.send_message = AsyncMock(return_value=mock_chat_response)
+        repl.session.prompt_async = scripted_prompt("/opus", "Hello", "/quit")
+        calls: list[dict[str, object]] = []
+
+        async def fake_send(message: str, **kwargs: object) -> ChatResponse:
+            calls.append(kwargs)
+            return MOCK_CHAT_RESPONSE
+
+        repl.chat_client.send_message = fake_send
 
         with patch("claudius.repl.estimate_cost", new_callable=AsyncMock) as mock_estimate:
             mock_estimate.return_value = mock_estimation
             await repl.run()
 
         # Verify send_message was called with model_override="opus"
-        call_kwargs = repl.chat_client.send_message.call_args[1]
-        assert call_kwargs.get("model_override") == "opus"
+        assert calls[-1].get("model_override") == "opus"
 
     async def test_model_override_is_cleared_after_use(
-        self, repl: ClaudiusREPL, mock_chat_response: ChatResponse, mock_estimation: EstimationResult
+        self, repl: ClaudiusREPL, mock_estimation: EstimationResult
     ) -> None:
         """Test that model override is cleared after chat message."""
-        repl.session.prompt_async = AsyncMock(
-            side_effect=["/opus", "First message", "Second message", "/quit"]
-        )
-        repl.chat_client.send_message = AsyncMock(return_value=mock_chat_response)
+        repl.session.prompt_async = scripted_prompt("/opus", "First message", "Second message", "/quit")
+        repl.chat_client.send_message = AsyncMock(return_value=MOCK_CHAT_RESPONSE)
 
         with patch("claudius.repl.estimate_cost", new_callable=AsyncMock) as mock_estimate:
             mock_estimate.return_value = mock_estimation
@@ -303,40 +334,27 @@ class TestClaudiusREPLChatHandling:
         assert calls[1][1].get("model_override") is None
 
     async def test_cost_is_recorded_in_tracker(
-        self, repl: ClaudiusREPL, mock_chat_response: ChatResponse, mock_estimation: EstimationResult
+        self,
+        repl: ClaudiusREPL,
+        mock_estimation: EstimationResult,
     ) -> None:
         """Test that cost is recorded in budget tracker after chat."""
-        repl.session.prompt_async = AsyncMock(side_effect=["Hello", "/quit"])
-        repl.chat_client.send_message = AsyncMock(return_value=mock_chat_response)
+        repl.session.prompt_async = scripted_prompt("Hello", "/quit")
+        repl.chat_client.send_message = AsyncMock(return_value=MOCK_CHAT_RESPONSE)
+        repl.tracker.record_usage = Mock()
 
         with patch("claudius.repl.estimate_cost", new_callable=AsyncMock) as mock_estimate:
             mock_estimate.return_value = mock_estimation
-            with patch.object(repl.tracker, "record_usage") as mock_record:
-                await repl.run()
+            await repl.run()
 
-                mock_record.assert_called_once()
-                call_kwargs = mock_record.call_args[1]
-                assert call_kwargs["cost"] == mock_chat_response.cost
+        repl.tracker.record_usage.assert_called_once()
+        call_kwargs = repl.tracker.record_usage.call_args[1]
+        assert call_kwargs["cost"] == MOCK_CHAT_RESPONSE.cost
 
 
 class TestClaudiusREPLEdgeCases:
     """Tests for edge cases in REPL behavior."""
 
-    @pytest.fixture
-    def temp_db(self) -> Path:
-        """Create a temporary database file."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-            return Path(f.name)
-
-    @pytest.fixture
-    def repl(self, temp_db: Path) -> ClaudiusREPL:
-        """Create a REPL instance for testing with confirmation skipped."""
-        tracker = BudgetTracker(db_path=temp_db)
-        config = Config()
-        repl = ClaudiusREPL(tracker=tracker, config=config, api_key="sk-ant-test123")
-        repl.skip_confirmation = True  # Skip confirmation dialog in tests
-        return repl
-
     @pytest.fixture
     def mock_estimation(self) -> EstimationResult:
         """Create a mock estimation result."""
@@ -354,7 +372,7 @@ class TestClaudiusREPLEdgeCases:
 
     async def test_empty_input_is_skipped(self, repl: ClaudiusREPL) -> None:
         """Test that empty input is skipped."""
-        repl.session.prompt_async = AsyncMock(side_effect=["", "/quit"])
+        repl.session.prompt_async = scripted_prompt("", "/quit")
         repl.chat_client.send_message = AsyncMock()
 
         await repl.run()
@@ -364,7 +382,7 @@ class TestClaudiusREPLEdgeCases:
 
     async def test_whitespace_only_input_is_skipped(self, repl: ClaudiusREPL) -> None:
         """Test that whitespace-only input is skipped."""
-        repl.session.prompt_async = AsyncMock(side_effect=["   ", "\t\n", "/quit"])
+        repl.session.prompt_async = scripted_prompt("   ", "\t\n", "/quit")
         repl.chat_client.send_message = AsyncMock()
 
         await repl.run()
@@ -378,33 +396,24 @@ class TestClaudiusREPLEdgeCases:
         """Test that chat errors are handled gracefully."""
         from claudius.chat import ChatError
 
-        repl.session.prompt_async = AsyncMock(side_effect=["Hello", "/quit"])
+        repl.session.prompt_async = scripted_prompt("Hello", "/quit")
         repl.chat_client.send_message = AsyncMock(
             side_effect=ChatError("Connection refused")
         )
 
         with patch("claudius.repl.estimate_cost", new_callable=AsyncMock) as mock_estimate:
             mock_estimate.return_value = mock_estimation
-            with patch.object(repl.console, "print"):
-                await repl.run()
-                # Should print error message but not crash - just verify it completed
+            repl.console = _CountingConsole()
+            await repl.run()
+            # Should print error message but not crash - just verify it completed
 
 
 class TestClaudiusREPLHistory:
     """Tests for REPL history functionality."""
 
-    @pytest.fixture
-    def temp_db(self) -> Path:
-        """Create a temporary database file."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-            return Path(f.name)
-
-    def test_history_file_path_is_set(self, temp_db: Path) -> None:
+    def test_history_file_path_is_set(self, memory_tracker: BudgetTracker) -> None:
         """Test that history file path is set correctly."""
-        tracker = BudgetTracker(db_path=temp_db)
-        config = Config()
-
-        repl = ClaudiusREPL(tracker=tracker, config=config, api_key="sk-ant-test123")
+        repl = ClaudiusREPL(tracker=memory_tracker, config=BASE_CONFIG, api_key="sk-ant-test123")
 
         # History should be FileHistory pointing to ~/.claudius/history
         from prompt_toolkit.history import FileHistory
@@ -415,21 +424,6 @@ class TestClaudiusREPLHistory:
 class TestClaudiusREPLCostEstimation:
     """Tests for REPL cost estimation display."""
 
-    @pytest.fixture
-    def temp_db(self) -> Path:
-        """Create a temporary database file."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-            return Path(f.name)
-
-    @pytest.fixture
-    def repl(self, temp_db: Path) -> ClaudiusREPL:
-        """Create a REPL instance for testing with confirmation skipped."""
-        tracker = BudgetTracker(db_path=temp_db)
-        config = Config()
-        repl = ClaudiusREPL(tracker=tracker, config=config, api_key="sk-ant-test123")
-        repl.skip_confirmation = True  # Skip confirmation dialog in tests
-        return repl
-
     @pytest.fixture
     def mock_chat_response(self) -> ChatResponse:
         """Create a mock chat response."""
@@ -460,7 +454,7 @@ class TestClaudiusREPLCostEstimation:
         self, repl: ClaudiusREPL, mock_chat_response: ChatResponse, mock_estimation: EstimationResult
     ) -> None:
         """Test that cost estimation is called before sending message."""
-        repl.session.prompt_async = AsyncMock(side_effect=["Hello", "/quit"])
+        repl.session.prompt_async = scripted_prompt("Hello", "/quit")
         repl.chat_client.send_message = AsyncMock(return_value=mock_chat_response)
 
         with patch("claudius.repl.estimate_cost", new_callable=AsyncMock) as mock_estimate:
@@ -474,23 +468,23 @@ class TestClaudiusREPLCostEstimation:
         self, repl: ClaudiusREPL, mock_chat_response: ChatResponse, mock_estimation: EstimationResult
     ) -> None:
         """Test that cost estimation output is printed to console."""
-        repl.session.prompt_async = AsyncMock(side_effect=["Hello", "/quit"])
+        repl.session.prompt_async = scripted_prompt("Hello", "/quit")
         repl.chat_client.send_message = AsyncMock(return_value=mock_chat_response)
 
         with patch("claudius.repl.estimate_cost", new_callable=AsyncMock) as mock_estimate:
             mock_estimate.return_value = mock_estimation
 
-            with patch.object(repl.console, "print") as mock_print:
-                await repl.run()
+            repl.console = _CountingConsole()
+            await repl.run()
 
-                # Should print: banner, budget bars, cost estimate, response, cost line
-                assert mock_print.call_count >= 5
+            # Should print: banner, budget bars, cost estimate, response, cost line
+            assert repl.console.prints >= 5
 
     async def test_cost_estimation_uses_correct_model(
         self, repl: ClaudiusREPL, mock_chat_response: ChatResponse, mock_estimation: EstimationResult
     ) -> None:
         """Test that cost estimation uses the routed model."""
-        repl.session.prompt_async = AsyncMock(side_effect=["Hello", "/quit"])
+        repl.session.prompt_async = scripted_prompt("Hello", "/quit")
         repl.chat_client.send_message = AsyncMock(return_value=mock_chat_response)
 
         with patch("claudius.repl.estimate_cost", new_callable=AsyncMock) as mock_estimate:
@@ -506,7 +500,7 @@ class TestClaudiusREPLCostEstimation:
         self, repl: ClaudiusREPL, mock_chat_response: ChatResponse, mock_estimation: EstimationResult
     ) -> None:
         """Test that cost estimation respects model override."""
-        repl.session.prompt_async = AsyncMock(side_effect=["/opus", "Hello", "/quit"])
+        repl.session.prompt_async = scripted_prompt("/opus", "Hello", "/quit")
         repl.chat_client.send_message = AsyncMock(return_value=mock_chat_response)
 
         with patch("claudius.repl.estimate_cost", new_callable=AsyncMock) as mock_estimate:
@@ -521,9 +515,7 @@ class TestClaudiusREPLCostEstimation:
         self, repl: ClaudiusREPL, mock_chat_response: ChatResponse, mock_estimation: EstimationResult
     ) -> None:
         """Test that cost estimation includes conversation history."""
-        repl.session.prompt_async = AsyncMock(
-            side_effect=["First message", "Second message", "/quit"]
-        )
+        repl.session.prompt_async = scripted_prompt("First message", "Second message", "/quit")
 
         # Create a side effect that updates conversation history like the real implementation
         async def send_with_history(message: str, **kwargs):  # noqa: ANN003, ARG001
@@ -552,7 +544,7 @@ class TestClaudiusREPLCostEstimation:
         self, repl: ClaudiusREPL, mock_chat_response: ChatResponse, mock_estimation: EstimationResult
     ) -> None:
         """Test that cost estimation uses the API key."""
-        repl.session.prompt_async = AsyncMock(side_effect=["Hello", "/quit"])
+        repl.session.prompt_async = scripted_prompt("Hello", "/quit")
         repl.chat_client.send_message = AsyncMock(return_value=mock_chat_response)
 
         with patch("claudius.repl.estimate_cost", new_callable=AsyncMock) as mock_estimate:
@@ -563,36 +555,17 @@ class TestClaudiusREPLCostEstimation:
             call_kwargs = mock_estimate.call_args[1]
             assert call_kwargs["api_key"] == "sk-ant-test123"
 
-    async def test_repl_stores_api_key(self, temp_db: Path) -> None:
+    async def test_repl_stores_api_key(self, fresh_repl: Callable[..., ClaudiusREPL]) -> None:
         """Test that REPL stores the API key for estimation."""
-        tracker = BudgetTracker(db_path=temp_db)
-        config = Config()
-
-        repl = ClaudiusREPL(tracker=tracker, config=config, api_key="sk-ant-test123")
+        repl = fresh_repl()
 
         assert repl.api_key == "sk-ant-test123"
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestClaudiusREPLBudgetAlerts:
     """Tests for REPL budget alert display."""
 
-    @pytest.fixture
-    def temp_db(self) -> Path:
-        """Create a temporary database file."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-            return Path(f.name)
-
-    @pytest.fixture
-    def mock_chat_response(self) -> ChatResponse:
-        """Create a mock chat response."""
-        return ChatResponse(
-            model="sonnet",
-            text="Hello! How can I help you?",
-            input_tokens=100,
-            output_tokens=50,
-            cost=0.005,
-        )
-
     @pytest.fixture
     def mock_estimation(self) -> EstimationResult:
         """Create a mock estimation result."""
@@ -609,10 +582,10 @@ class TestClaudiusREPLBudgetAlerts:
         )
 
     async def test_daily_alert_shown_at_80_percent(
-        self, temp_db: Path, mock_chat_response: ChatResponse, mock_estimation: EstimationResult
+        self, tmp_path: Path, mock_estimation: EstimationResult
     ) -> None:
         """Test that daily budget alert is shown when daily spending reaches 80%."""
-        tracker = BudgetTracker(db_path=temp_db)
+        tracker = BudgetTracker(db_path=tmp_path / "budget.db")
         config = Config()
         # Set daily budget to 10 and pre-spend 7.5 (75%), then chat adds 0.005 to reach ~75%
         config.budget.daily_soft = 10.0
@@ -629,31 +602,23 @@ class TestClaudiusREPLBudgetAlerts:
 
         repl = ClaudiusREPL(tracker=tracker, config=config, api_key="sk-ant-test123")
         repl.skip_confirmation = True  # Skip confirmation dialog in tests
-        repl.session.prompt_async = AsyncMock(side_effect=["Hello", "/quit"])
-        repl.chat_client.send_message = AsyncMock(return_value=mock_chat_response)
-
-        printed_outputs: list[str] = []
+        repl.session.prompt_async = scripted_prompt("Hello", "/quit")
+        repl.chat_client.send_message = AsyncMock(return_value=MOCK_CHAT_RESPONSE)
 
-        def capture_print(renderable: object) -> None:
-            console = Console(force_terminal=True, width=100)
-            with console.capture() as capture:
-                console.print(renderable)
-            printed_outputs.append(capture.get())
+        repl.console = _RecordingConsole()
 
         with patch("claudius.repl.estimate_cost", new_callable=AsyncMock) as mock_estimate:
             mock_estimate.return_value = mock_estimation
-            with patch.object(repl.console, "print", side_effect=capture_print):
-                await repl.run()
+            await repl.run()
 
         # Check that daily alert was printed
-        all_output = "".join(printed_outputs)
-        assert "Daily budget" in all_output
+        _assert_contains(repl.console.out, "Daily budget")
 
     async def test_monthly_alert_shown_at_80_percent(
-        self, temp_db: Path, mock_chat_response: ChatResponse, mock_estimation: EstimationResult
+        self, tmp_path: Path, mock_estimation: EstimationResult
     ) -> None:
         """Test that monthly budget alert is shown when monthly spending reaches 80%."""
-        tracker = BudgetTracker(db_path=temp_db)
+        tracker = BudgetTracker(db_path=tmp_path / "budget.db")
         config = Config()
         # Set monthly budget to 100 and pre-spend enough to reach 80%
         config.budget.monthly = 100.0
@@ -669,31 +634,23 @@ class TestClaudiusREPLBudgetAlerts:
 
         repl = ClaudiusREPL(tracker=tracker, config=config, api_key="sk-ant-test123")
         repl.skip_confirmation = True  # Skip confirmation dialog in tests
-        repl.session.prompt_async = AsyncMock(side_effect=["Hello", "/quit"])
-        repl.chat_client.send_message = AsyncMock(return_value=mock_chat_response)
-
-        printed_outputs: list[str] = []
+        repl.session.prompt_async = scripted_prompt("Hello", "/quit")
+        repl.chat_client.send_message = AsyncMock(return_value=MOCK_CHAT_RESPONSE)
 
-        def capture_print(renderable: object) -> None:
-            console = Console(force_terminal=True, width=100)
-            with console.capture() as capture:
-                console.print(renderable)
-            printed_outputs.append(capture.get())
+        repl.console = _RecordingConsole()
 
         with patch("claudius.repl.estimate_cost", new_callable=AsyncMock) as mock_estimate:
             mock_estimate.return_value = mock_estimation
-            with patch.object(repl.console, "print", side_effect=capture_print):
-                await repl.run()
+            await repl.run()
 
         # Check that monthly alert was printed
-        all_output = "".join(printed_outputs)
-        assert "Monthly budget" in all_output
+        _assert_contains(repl.console.out, "Monthly budget")
 
     async def test_no_alert_under_80_percent(
-        self, temp_db: Path, mock_chat_response: ChatResponse, mock_estimation: EstimationResult
+        self, tmp_path: Path, mock_estimation: EstimationResult
     ) -> None:
         """Test that no budget alert is shown when spending is under 80%."""
-        tracker = BudgetTracker(db_path=temp_db)
+        tracker = BudgetTracker(db_path=tmp_path / "budget.db")
         config = Config()
         # Set budgets high enough that we stay under 80%
         config.budget.monthly = 1000.0
@@ -701,89 +658,59 @@ class TestClaudiusREPLBudgetAlerts:
 
         repl = ClaudiusREPL(tracker=tracker, config=config, api_key="sk-ant-test123")
         repl.skip_confirmation = True  # Skip confirmation dialog in tests
-        repl.session.prompt_async = AsyncMock(side_effect=["Hello", "/quit"])
-        repl.chat_client.send_message = AsyncMock(return_value=mock_chat_response)
+        repl.session.prompt_async = scripted_prompt("Hello", "/quit")
+        repl.chat_client.send_message = AsyncMock(return_value=MOCK_CHAT_RESPONSE)
 
-        printed_outputs: list[str] = []
-
-        def capture_print(renderable: object) -> None:
-            console = Console(force_terminal=True, width=100)
-            with console.capture() as capture:
-                console.print(renderable)
-            printed_outputs.append(capture.get())
+        repl.console = _RecordingConsole()
 
         with patch("claudius.repl.estimate_cost", new_callable=AsyncMock) as mock_estimate:
             mock_estimate.return_value = mock_estimation
-            with patch.object(repl.console, "print", side_effect=capture_print):
-                await repl.run()
+            await repl.run()
 
         # Check that neither budget alert was printed (using keywords from alert rendering)
-        all_output = "".join(printed_outputs)
         # The budget bars show "Monthly" and "Today", but alerts use "Daily budget" and "Monthly budget"
-        assert "Daily budget at" not in all_output
-        assert "Monthly budget at" not in all_output
+        assert not _find_needles(repl.console.out, "Daily budget at", "Monthly budget at")
 
     async def test_both_alerts_shown_when_both_exceed_threshold(
-        self, temp_db: Path, mock_chat_response: ChatResponse, mock_estimation: EstimationResult
+        self, tmp_path: Path, mock_estimation: EstimationResult
     ) -> None:
         """Test that both daily and monthly alerts are shown when both exceed 80%."""
-        tracker = BudgetTracker(db_path=temp_db)
+        tracker = BudgetTracker(db_path=tmp_path / "budget.db")
         config = Config()
         # Set both budgets low enough that we exceed 80%
         config.budget.monthly = 100.0
         config.budget.daily_soft = 10.0
 
-        # Pre-record spending to push both over 80%
+        # Pre-record a single spend large enough to push both over 80%
         tracker.record_usage(
             model="test-model",
-            input_tokens=100,
-            output_tokens=100,
-            cost=79.996,  # 79.996 + 0.005 = 80.001% of monthly
-        )
-        # Also record more to push daily over
-        tracker.record_usage(
-            model="test-model",
-            input_tokens=100,
-            output_tokens=100,
-            cost=7.999,  # Additional to push daily: 79.996 + 7.999 + 0.005 = 87.996 daily
+            input_tokens=200,
+            output_tokens=200,
+            cost=87.995,
         )
 
-        # Now daily spent is 79.996 + 7.999 = 87.995, plus 0.005 = 88.0 (880% of daily)
+        # After the chat adds 0.005, daily spent is 88.0 (880% of daily)
         # Monthly spent is also 88.0 (88% of monthly)
 
         repl = ClaudiusREPL(tracker=tracker, config=config, api_key="sk-ant-test123")
         repl.skip_confirmation = True  # Skip confirmation dialog in tests
-        repl.session.prompt_async = AsyncMock(side_effect=["Hello", "/quit"])
-        repl.chat_client.send_message = AsyncMock(return_value=mock_chat_response)
-
-        printed_outputs: list[str] = []
+        repl.session.prompt_async = scripted_prompt("Hello", "/quit")
+        repl.chat_client.send_message = AsyncMock(return_value=MOCK_CHAT_RESPONSE)
 
-        def capture_print(renderable: object) -> None:
-            console = Console(force_terminal=True, width=100)
-            with console.capture() as capture:
-                console.print(renderable)
-            printed_outputs.append(capture.get())
+        repl.console = _RecordingConsole()
 
         with patch("claudius.repl.estimate_cost", new_callable=AsyncMock) as mock_estimate:
             mock_estimate.return_value = mock_estimation
-            with patch.object(repl.console, "print", side_effect=capture_print):
-                await repl.run()
+            await repl.run()
 
         # Check that both alerts were printed
-        all_output = "".join(printed_outputs)
-        assert "Daily budget" in all_output
-        assert "Monthly budget" in all_output
+        _assert_contains(repl.console.out, "Daily budget", "Monthly budget")
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestClaudiusREPLDailyHardLimit:
     """Tests for REPL daily hard limit enforcement."""
 
-    @pytest.fixture
-    def temp_db(self) -> Path:
-        """Create a temporary database file."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-            return Path(f.name)
-
     @pytest.fixture
     def mock_chat_response(self) -> ChatResponse:
         """Create a mock chat response."""
@@ -811,10 +738,10 @@ class TestClaudiusREPLDailyHardLimit:
         )
 
     async def test_hard_limit_forces_haiku_model(
-        self, temp_db: Path, mock_chat_response: ChatResponse, mock_estimation: EstimationResult
+        self, tmp_path: Path, mock_chat_response: ChatResponse, mock_estimation: EstimationResult
     ) -> None:
         """Test that exceeding daily hard limit forces Haiku model."""
-        tracker = BudgetTracker(db_path=temp_db)
+        tracker = BudgetTracker(db_path=tmp_path / "budget.db")
         config = Config()
         config.budget.daily_hard = 10.0
 
@@ -829,7 +756,7 @@ class TestClaudiusREPLDailyHardLimit:
 
         repl = ClaudiusREPL(tracker=tracker, config=config, api_key="sk-ant-test123")
         repl.skip_confirmation = True  # Skip confirmation dialog in tests
-        repl.session.prompt_async = AsyncMock(side_effect=["Hello", "/quit"])
+        repl.session.prompt_async = scripted_prompt("Hello", "/quit")
         repl.chat_client.send_message = AsyncMock(return_value=mock_chat_response)
 
         with patch("claudius.repl.estimate_cost", new_callable=AsyncMock) as mock_estimate:
@@ -841,10 +768,10 @@ class TestClaudiusREPLDailyHardLimit:
         assert call_kwargs.get("model_override") == "haiku"
 
     async def test_hard_limit_shows_warning_message(
-        self, temp_db: Path, mock_chat_response: ChatResponse, mock_estimation: EstimationResult
+        self, tmp_path: Path, mock_chat_response: ChatResponse, mock_estimation: EstimationResult
     ) -> None:
         """Test that exceeding daily hard limit shows a warning message."""
-        tracker = BudgetTracker(db_path=temp_db)
+        tracker = BudgetTracker(db_path=tmp_path / "budget.db")
         config = Config()
         config.budget.daily_hard = 10.0
 
@@ -859,30 +786,22 @@ class TestClaudiusREPLDailyHardLimit:
 
         repl = ClaudiusREPL(tracker=tracker, config=config, api_key="sk-ant-test123")
         repl.skip_confirmation = True  # Skip confirmation dialog in tests
-        repl.session.prompt_async = AsyncMock(side_effect=["Hello", "/quit"])
+        repl.session.prompt_async = scripted_prompt("Hello", "/quit")
         repl.chat_client.send_message = AsyncMock(return_value=mock_chat_response)
 
-        printed_outputs: list[str] = []
-
-        def capture_print(renderable: object) -> None:
-            console = Console(force_terminal=True, width=100)
-            with console.capture() as capture:
-                console.print(renderable)
-            printed_outputs.append(capture.get())
+        repl.console = _RecordingConsole()
 
         with patch("claudius.repl.estimate_cost", new_callable=AsyncMock) as mock_estimate:
             mock_estimate.return_value = mock_estimation
-            with patch.object(repl.console, "print", side_effect=capture_print):
-                await repl.run()
+            await repl.run()
 
-        all_output = "".join(printed_outputs)
-        assert "Daily hard limit reached" in all_output or "hard limit" in all_output.lower()
+        _assert_contains(repl.console.out, "hard limit")
 
     async def test_hard_limit_allows_manual_override(
-        self, temp_db: Path, mock_chat_response: ChatResponse, mock_estimation: EstimationResult
+        self, tmp_path: Path, mock_chat_response: ChatResponse, mock_estimation: EstimationResult
     ) -> None:
         """Test that user can manually override to expensive model despite hard limit."""
-        tracker = BudgetTracker(db_path=temp_db)
+        tracker = BudgetTracker(db_path=tmp_path / "budget.db")
         config = Config()
         config.budget.daily_hard = 10.0
 
@@ -898,7 +817,7 @@ class TestClaudiusREPLDailyHardLimit:
         repl = ClaudiusREPL(tracker=tracker, config=config, api_key="sk-ant-test123")
         repl.skip_confirmation = True  # Skip confirmation dialog in tests
         # User explicitly requests opus with /opus command
-        repl.session.prompt_async = AsyncMock(side_effect=["/opus", "Hello", "/quit"])
+        repl.session.prompt_async = scripted_prompt("/opus", "Hello", "/quit")
         repl.chat_client.send_message = AsyncMock(return_value=mock_chat_response)
 
         with patch("claudius.repl.estimate_cost", new_callable=AsyncMock) as mock_estimate:
@@ -910,10 +829,10 @@ class TestClaudiusREPLDailyHardLimit:
         assert call_kwargs.get("model_override") == "opus"
 
     async def test_hard_limit_override_shows_warning(
-        self, temp_db: Path, mock_chat_response: ChatResponse, mock_estimation: EstimationResult
+        self, tmp_path: Path, mock_chat_response: ChatResponse, mock_estimation: EstimationResult
     ) -> None:
         """Test that overriding hard limit with expensive model shows warning."""
-        tracker = BudgetTracker(db_path=temp_db)
+        tracker = BudgetTracker(db_path=tmp_path / "budget.db")
         config = Config()
         config.budget.daily_hard = 10.0
 
@@ -929,32 +848,23 @@ class TestClaudiusREPLDailyHardLimit:
         repl = ClaudiusREPL(tracker=tracker, config=config, api_key="sk-ant-test123")
         repl.skip_confirmation = True  # Skip confirmation dialog in tests
         # User explicitly requests opus
-        repl.session.prompt_async = AsyncMock(side_effect=["/opus", "Hello", "/quit"])
+        repl.session.prompt_async = scripted_prompt("/opus", "Hello", "/quit")
         repl.chat_client.send_message = AsyncMock(return_value=mock_chat_response)
 
-        printed_outputs: list[str] = []
-
-        def capture_print(renderable: object) -> None:
-            console = Console(force_terminal=True, width=100)
-            with console.capture() as capture:
-                console.print(renderable)
-            printed_outputs.append(capture.get())
+        repl.console = _RecordingConsole()
 
         with patch("claudius.repl.estimate_cost", new_callable=AsyncMock) as mock_estimate:
             mock_estimate.return_value = mock_estimation
-            with patch.object(repl.console, "print", side_effect=capture_print):
-                await repl.run()
+            await repl.run()
 
-        all_output = "".join(printed_outputs)
         # Should warn that user is overriding despite hard limit
-        assert "hard limit" in all_output.lower()
-        assert "opus" in all_output.lower()
+        _assert_contains(repl.console.out, "hard limit", "opus")
 
     async def test_no_hard_limit_enforcement_when_under_limit(
-        self, temp_db: Path, mock_chat_response: ChatResponse, mock_estimation: EstimationResult
+        self, tmp_path: Path, mock_chat_response: ChatResponse, mock_estimation: EstimationResult
     ) -> None:
         """Test that no hard limit enforcement happens when under the limit."""
-        tracker = BudgetTracker(db_path=temp_db)
+        tracker = BudgetTracker(db_path=tmp_path / "budget.db")
         config = Config()
         config.budget.daily_hard = 10.0
 
@@ -969,36 +879,23 @@ class TestClaudiusREPLDailyHardLimit:
 
         repl = ClaudiusREPL(tracker=tracker, config=config, api_key="sk-ant-test123")
         repl.skip_confirmation = True  # Skip confirmation dialog in tests
-        repl.session.prompt_async = AsyncMock(side_effect=["Hello", "/quit"])
+        repl.session.prompt_async = scripted_prompt("Hello", "/quit")
         repl.chat_client.send_message = AsyncMock(return_value=mock_chat_response)
 
-        printed_outputs: list[str] = []
-
-        def capture_print(renderable: object) -> None:
-            console = Console(force_terminal=True, width=100)
-            with console.capture() as capture:
-                console.print(renderable)
-            printed_outputs.append(capture.get())
+        repl.console = _RecordingConsole()
 
         with patch("claudius.repl.estimate_cost", new_callable=AsyncMock) as mock_estimate:
             mock_estimate.return_value = mock_estimation
-            with patch.object(repl.console, "print", side_effect=capture_print):
-                await repl.run()
+            await repl.run()
 
-        all_output = "".join(printed_outputs)
         # Should not see hard limit warning
-        assert "hard limit" not in all_output.lower()
+        assert not _find_needles(repl.console.out, "hard limit")
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestClaudiusREPLConfirmationDialog:
     """Tests for REPL interactive confirmation dialog."""
 
-    @pytest.fixture
-    def temp_db(self) -> Path:
-        """Create a temporary database file."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-            return Path(f.name)
-
     @pytest.fixture
     def mock_chat_response(self) -> ChatResponse:
         """Create a mock chat response."""
@@ -1026,14 +923,12 @@ class TestClaudiusREPLConfirmationDialog:
         )
 
     async def test_confirmation_dialog_send_proceeds(
-        self, temp_db: Path, mock_chat_response: ChatResponse, mock_estimation: EstimationResult
+        self, memory_tracker: BudgetTracker, mock_chat_response: ChatResponse, mock_estimation: EstimationResult
     ) -> None:
         """Test that 'Send' action in confirmation dialog sends the message."""
         from claudius.repl import ConfirmationResult
 
-        tracker = BudgetTracker(db_path=temp_db)
-        config = Config()
-        repl = ClaudiusREPL(tracker=tracker, config=config, api_key="sk-ant-test123")
+        repl = ClaudiusREPL(tracker=memory_tracker, config=BASE_CONFIG, api_key="sk-ant-test123")
 
         # Mock the confirmation dialog to return "send"
         mock_confirmation = AsyncMock(
@@ -1041,7 +936,7 @@ class TestClaudiusREPLConfirmationDialog:
         )
         repl._show_confirmation_dialog = mock_confirmation
 
-        repl.session.prompt_async = AsyncMock(side_effect=["Hello", "/quit"])
+        repl.session.prompt_async = scripted_prompt("Hello", "/quit")
         repl.chat_client.send_message = AsyncMock(return_value=mock_chat_response)
 
         with patch("claudius.repl.estimate_cost", new_callable=AsyncMock) as mock_estimate:
@@ -1054,14 +949,12 @@ class TestClaudiusREPLConfirmationDialog:
         mock_confirmation.assert_called_once()
 
     async def test_confirmation_dialog_cancel_returns_to_prompt(
-        self, temp_db: Path, mock_chat_response: ChatResponse, mock_estimation: EstimationResult
+        self, memory_tracker: BudgetTracker, mock_chat_response: ChatResponse, mock_estimation: EstimationResult
     ) -> None:
         """Test that 'Cancel' action in confirmation dialog returns to input without sending."""
         from claudius.repl import ConfirmationResult
 
-        tracker = BudgetTracker(db_path=temp_db)
-        config = Config()
-        repl = ClaudiusREPL(tracker=tracker, config=config, api_key="sk-ant-test123")
+        repl = ClaudiusREPL(tracker=memory_tracker, config=BASE_CONFIG, api_key="sk-ant-test123")
 
         # Mock the confirmation dialog to return "cancel"
         mock_confirmation = AsyncMock(
@@ -1069,7 +962,7 @@ class TestClaudiusREPLConfirmationDialog:
         )
         repl._show_confirmation_dialog = mock_confirmation
 
-        repl.session.prompt_async = AsyncMock(side_effect=["Hello", "/quit"])
+        repl.session.prompt_async = scripted_prompt("Hello", "/quit")
         repl.chat_client.send_message = AsyncMock(return_value=mock_chat_response)
 
         with patch("claudius.repl.estimate_cost", new_callable=AsyncMock) as mock_estimate:
@@ -1082,14 +975,12 @@ class TestClaudiusREPLConfirmationDialog:
         mock_confirmation.assert_called_once()
 
     async def test_confirmation_dialog_change_model_updates_model(
-        self, temp_db: Path, mock_chat_response: ChatResponse, mock_estimation: EstimationResult
+        self, memory_tracker: BudgetTracker, mock_chat_response: ChatResponse, mock_estimation: EstimationResult
     ) -> None:
         """Test that 'Change Model' action updates the model and re-estimates."""
         from claudius.repl import ConfirmationResult
 
-        tracker = BudgetTracker(db_path=temp_db)
-        config = Config()
-        repl = ClaudiusREPL(tracker=tracker, config=config, api_key="sk-ant-test123")
+        repl = ClaudiusREPL(tracker=memory_tracker, config=BASE_CONFIG, api_key="sk-ant-test123")
 
         # First call returns "change" with opus, second call returns "send"
         mock_confirmation = AsyncMock(
@@ -1100,7 +991,7 @@ class TestClaudiusREPLConfirmationDialog:
         )
         repl._show_confirmation_dialog = mock_confirmation
 
-        repl.session.prompt_async = AsyncMock(side_effect=["Hello", "/quit"])
+        repl.session.prompt_async = scripted_prompt("Hello", "/quit")
         repl.chat_client.send_message = AsyncMock(return_value=mock_chat_response)
 
         with patch("claudius.repl.estimate_cost", new_callable=AsyncMock) as mock_estimate:
@@ -1119,14 +1010,12 @@ class TestClaudiusREPLConfirmationDialog:
         assert call_kwargs.get("model_override") == "opus"
 
     async def test_skip_confirmation_flag_bypasses_dialog(
-        self, temp_db: Path, mock_chat_response: ChatResponse, mock_estimation: EstimationResult
+        self, memory_tracker: BudgetTracker, mock_chat_response: ChatResponse, mock_estimation: EstimationResult
     ) -> None:
         """Test that skip_confirmation=True bypasses the confirmation dialog."""
         from claudius.repl import ConfirmationResult
 
-        tracker = BudgetTracker(db_path=temp_db)
-        config = Config()
-        repl = ClaudiusREPL(tracker=tracker, config=config, api_key="sk-ant-test123")
+        repl = ClaudiusREPL(tracker=memory_tracker, config=BASE_CONFIG, api_key="sk-ant-test123")
         repl.skip_confirmation = True
 
         # Set up mock that should NOT be called
@@ -1135,7 +1024,7 @@ class TestClaudiusREPLConfirmationDialog:
         )
         repl._show_confirmation_dialog = mock_confirmation
 
-        repl.session.prompt_async = AsyncMock(side_effect=["Hello", "/quit"])
+        repl.session.prompt_async = scripted_prompt("Hello", "/quit")
         repl.chat_client.send_message = AsyncMock(return_value=mock_chat_response)
 
         with patch("claudius.repl.estimate_cost", new_callable=AsyncMock) as mock_estimate:
@@ -1167,14 +1056,12 @@ class TestClaudiusREPLConfirmationDialog:
         assert change_result.model == "opus"
 
     async def test_model_override_cleared_on_cancel(
-        self, temp_db: Path, mock_chat_response: ChatResponse, mock_estimation: EstimationResult
+        self, memory_tracker: BudgetTracker, mock_chat_response: ChatResponse, mock_estimation: EstimationResult
     ) -> None:
         """Test that model override is cleared when user cancels."""
         from claudius.repl import ConfirmationResult
 
-        tracker = BudgetTracker(db_path=temp_db)
-        config = Config()
-        repl = ClaudiusREPL(tracker=tracker, config=config, api_key="sk-ant-test123")
+        repl = ClaudiusREPL(tracker=memory_tracker, config=BASE_CONFIG, api_key="sk-ant-test123")
 
         # Set model override via /opus command, then cancel at confirmation
         mock_confirmation = AsyncMock(
@@ -1182,7 +1069,7 @@ class TestClaudiusREPLConfirmationDialog:
         )
         repl._show_confirmation_dialog = mock_confirmation
 
-        repl.session.prompt_async = AsyncMock(side_effect=["/opus", "Hello", "/quit"])
+        repl.session.prompt_async = scripted_prompt("/opus", "Hello", "/quit")
         repl.chat_client.send_message = AsyncMock(return_value=mock_chat_response)
 
         with patch("claudius.repl.estimate_cost", new_callable=AsyncMock) as mock_estimate:
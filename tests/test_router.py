@@ -7,6 +7,9 @@ Tests for Claudius Smart Router.
 Tests the routing logic that sends queries to the cheapest capable model.
 """
 
+from dataclasses import FrozenInstanceError
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
 
 from claudius.router import RouteDecision, SmartRouter
@@ -29,36 +32,44 @@ class TestRouteDecision:
         )
         assert decision.needs_classification is True
 
+    def test_route_decision_is_immutable(self) -> None:
+        """RouteDecision fields cannot be reassigned after construction."""
+        decision = RouteDecision(model="haiku", reason="test_reason")
+        with pytest.raises(FrozenInstanceError):
+            decision.model = "opus"  # type: ignore[misc]
+
 
 class TestSmartRouterHeuristics:
     """Tests for SmartRouter.classify() - FREE heuristics layer."""
 
-    def test_short_message_routes_to_haiku(self) -> None:
+    def test_short_message_routes_to_haiku(self, router: SmartRouter) -> None:
         """Messages under 20 words route to haiku."""
-        router = SmartRouter()
         result = router.classify("What is the capital of France?")
         assert result.model == "haiku"
         assert result.reason == "heuristic:short_message"
         assert result.needs_classification is False
 
-    def test_very_short_message_routes_to_haiku(self) -> None:
+    def test_very_short_message_routes_to_haiku(self, router: SmartRouter) -> None:
         """Very short messages (1-5 words) route to haiku."""
-        router = SmartRouter()
         result = router.classify("Hello")
         assert result.model == "haiku"
         assert result.reason == "heuristic:short_message"
 
-    def test_exactly_19_words_routes_to_haiku(self) -> None:
+    def test_exactly_19_words_routes_to_haiku(self, router: SmartRouter) -> None:
         """Message with exactly 19 words routes to haiku (under 20)."""
-        router = SmartRouter()
         message = " ".join(["word"] * 19)
         result = router.classify(message)
         assert result.model == "haiku"
         assert result.reason == "heuristic:short_message"
 
-    def test_code_block_routes_to_sonnet(self) -> None:
+    def test_exactly_20_words_is_not_short(self, router: SmartRouter) -> None:
+        """Message with exactly 20 words is past the short message threshold."""
+        message = " ".join(["word"] * 20)
+        result = router.classify(message)
+        assert result.needs_classification is True
+
+    def test_code_block_routes_to_sonnet(self, router: SmartRouter) -> None:
         """Messages with code blocks route to sonnet."""
-        router = SmartRouter()
         message = """Please review this code:
 ```python
 def hello():
@@ -70,140 +81,152 @@ def hello():
         assert result.reason == "heuristic:code_block"
         assert result.needs_classification is False
 
-    def test_code_block_single_backticks_does_not_trigger(self) -> None:
+    def test_code_block_single_backticks_does_not_trigger(self, router: SmartRouter) -> None:
         """Single backticks should not trigger code block heuristic."""
-        router = SmartRouter()
         # This is a long message with single backticks but no triple backticks
         message = "This is a message with `inline code` but no code blocks " * 5
         result = router.classify(message)
         # Should need classification since it's not short and has no code block
         assert result.needs_classification is True
 
-    def test_opus_keyword_architect_routes_to_opus(self) -> None:
-        """Messages with 'architect' keyword route to opus (must be 20+ words)."""
-        router = SmartRouter()
-        # 21 words - above the short message threshold
-        message = "I need you to architect a new system for our application that handles user authentication and payment processing with high availability and scalability requirements."
+    @pytest.mark.parametrize(
+        ("message", "keyword"),
+        [
+            pytest.param(
+                "I need you to architect a new system for our application that handles user authentication and payment processing with high availability and scalability requirements.",
+                "architect",
+                id="architect",
+            ),
+            pytest.param(
+                "Please design a comprehensive solution for our data pipeline that handles millions of records daily and needs to be fault tolerant and highly available.",
+                "design",
+                id="design",
+            ),
+            pytest.param(
+                "This is a complex problem that requires careful thought about the entire system structure and its dependencies across multiple services and data stores.",
+                "complex",
+                id="complex",
+            ),
+            pytest.param(
+                "I need you to plan out the migration strategy for our database that currently serves millions of users and must maintain zero downtime during the transition.",
+                "plan",
+                id="plan",
+            ),
+            pytest.param(
+                "Please analyze the performance metrics and identify bottlenecks in our system that need to be addressed to improve response times significantly.",
+                "analyze",
+                id="analyze",
+            ),
+            pytest.param(
+                "I need a comprehensive review of our codebase to identify all security vulnerabilities and best practices violations that could pose risks.",
+                "comprehensive",
+                id="comprehensive",
+            ),
+            pytest.param(
+                "Help me develop a strategy for migrating our monolithic application to a distributed system over time while maintaining business continuity throughout.",
+                "strategy",
+                id="strategy",
+            ),
+            pytest.param(
+                "Please review thoroughly all the changes in this pull request and provide detailed feedback on potential issues and security concerns.",
+                "review thoroughly",
+                id="review_thoroughly",
+            ),
+            pytest.param(
+                "I need you to ARCHITECT a system for handling large scale data processing and storage requirements across multiple geographic regions.",
+                "architect",
+                id="case_insensitive",
+            ),
+        ],
+    )
+    def test_opus_keyword_routes_to_opus(
+        self, router: SmartRouter, message: str, keyword: str
+    ) -> None:
+        """Messages of 20+ words with an opus keyword route to opus, case-insensitively."""
         result = router.classify(message)
         assert result.model == "opus"
-        assert "heuristic:opus_keyword" in result.reason
-        assert "architect" in result.reason
+        assert result.reason == f"heuristic:opus_keyword:{keyword}"
         assert result.needs_classification is False
 
-    def test_opus_keyword_design_routes_to_opus(self) -> None:
-        """Messages with 'design' keyword route to opus (must be 20+ words)."""
-        router = SmartRouter()
-        # 22 words
-        message = "Please design a comprehensive solution for our data pipeline that handles millions of records daily and needs to be fault tolerant and highly available."
-        result = router.classify(message)
-        assert result.model == "opus"
-        assert "design" in result.reason
-
-    def test_opus_keyword_complex_routes_to_opus(self) -> None:
-        """Messages with 'complex' keyword route to opus (must be 20+ words)."""
-        router = SmartRouter()
-        # 22 words - avoid using "architecture" which contains "architect"
-        message = "This is a complex problem that requires careful thought about the entire system structure and its dependencies across multiple services and data stores."
-        result = router.classify(message)
-        assert result.model == "opus"
-        assert "complex" in result.reason
-
-    def test_opus_keyword_plan_routes_to_opus(self) -> None:
-        """Messages with 'plan' keyword route to opus (must be 20+ words)."""
-        router = SmartRouter()
-        # 23 words
-        message = "I need you to plan out the migration strategy for our database that currently serves millions of users and must maintain zero downtime during the transition."
-        result = router.classify(message)
-        assert result.model == "opus"
-        assert "plan" in result.reason
-
-    def test_opus_keyword_analyze_routes_to_opus(self) -> None:
-        """Messages with 'analyze' keyword route to opus (must be 20+ words)."""
-        router = SmartRouter()
-        # 21 words
-        message = "Please analyze the performance metrics and identify bottlenecks in our system that need to be addressed to improve response times significantly."
-        result = router.classify(message)
-        assert result.model == "opus"
-        assert "analyze" in result.reason
-
-    def test_opus_keyword_comprehensive_routes_to_opus(self) -> None:
-        """Messages with 'comprehensive' keyword route to opus (must be 20+ words)."""
-        router = SmartRouter()
-        # 21 words
-        message = "I need a comprehensive review of our codebase to identify all security vulnerabilities and best practices violations that could pose risks."
-        result = router.classify(message)
-        assert result.model == "opus"
-        assert "comprehensive" in result.reason
-
-    def test_opus_keyword_strategy_routes_to_opus(self) -> None:
-        """Messages with 'strategy' keyword route to opus (must be 20+ words)."""
-        router = SmartRouter()
-        # 21 words - avoid using "architecture" which contains "architect"
-        message = "Help me develop a strategy for migrating our monolithic application to a distributed system over time while maintaining business continuity throughout."
-        result = router.classify(message)
-        assert result.model == "opus"
-        assert "strategy" in result.reason
-
-    def test_opus_keyword_review_thoroughly_routes_to_opus(self) -> None:
-        """Messages with 'review thoroughly' keyword route to opus (must be 20+ words)."""
-        router = SmartRouter()
-        # 21 words
-        message = "Please review thoroughly all the changes in this pull request and provide detailed feedback on potential issues and security concerns."
-        result = router.classify(message)
-        assert result.model == "opus"
-        assert "review thoroughly" in result.reason
-
-    def test_opus_keyword_case_insensitive(self) -> None:
-        """Opus keywords should match case-insensitively (must be 20+ words)."""
-        router = SmartRouter()
-        # 20 words
-        message = "I need you to ARCHITECT a system for handling large scale data processing and storage requirements across multiple geographic regions."
-        result = router.classify(message)
-        assert result.model == "opus"
-        assert "architect" in result.reason
-
-    def test_medium_message_needs_classification(self) -> None:
+    def test_medium_message_needs_classification(self, router: SmartRouter) -> None:
         """Medium-length messages without code or opus keywords need classification."""
-        router = SmartRouter()
         message = "Can you help me understand how to implement a simple web scraper that collects data from multiple pages and stores it in a database for later analysis and reporting?"
         result = router.classify(message)
         assert result.needs_classification is True
         assert result.model == "haiku"  # Default model when needs classification
         assert result.reason == "needs_classification"
 
-    def test_empty_string_routes_to_haiku(self) -> None:
+    def test_empty_string_routes_to_haiku(self, router: SmartRouter) -> None:
         """Empty string routes to haiku (short message)."""
-        router = SmartRouter()
         result = router.classify("")
         assert result.model == "haiku"
         assert result.reason == "heuristic:short_message"
 
-    def test_whitespace_only_routes_to_haiku(self) -> None:
+    def test_whitespace_only_routes_to_haiku(self, router: SmartRouter) -> None:
         """Whitespace-only message routes to haiku."""
-        router = SmartRouter()
         result = router.classify("   \n\t   ")
         assert result.model == "haiku"
         assert result.reason == "heuristic:short_message"
 
-    def test_very_long_message_without_keywords_needs_classification(self) -> None:
+    def test_very_long_message_without_keywords_needs_classification(self, router: SmartRouter) -> None:
         """Very long message without opus keywords needs classification."""
-        router = SmartRouter()
         message = "Please explain " + " ".join(["the"] * 100)
         result = router.classify(message)
         assert result.needs_classification is True
 
-    def test_code_block_takes_precedence_over_short_message(self) -> None:
+    def test_code_block_takes_precedence_over_short_message(self, router: SmartRouter) -> None:
         """Code block detection should work even for short messages."""
-        router = SmartRouter()
         message = "```print('hi')```"
         result = router.classify(message)
         # Code blocks route to sonnet even if short
         assert result.model == "sonnet"
         assert result.reason == "heuristic:code_block"
 
-    def test_opus_keyword_takes_precedence_over_code_block(self) -> None:
-        """Messages with both opus keyword and code blocks test priority."""
+    def test_short_message_takes_precedence_over_opus_keyword(self, router: SmartRouter) -> None:
+        """Short messages route to haiku even when they contain an opus keyword."""
+        result = router.classify("Can you design a logo?")
+        assert result.model == "haiku"
+        assert result.reason == "heuristic:short_message"
+
+    def test_repeated_message_returns_cached_decision(self) -> None:
+        """Classifying the same message twice returns the same decision object."""
         router = SmartRouter()
+        message = "Please architect " + " ".join(["the"] * 20)
+        first = router.classify(message)
+        assert router.classify(message) is first
+
+        router.reset_cache()
+        assert router.classify(message) is not first
+        assert router.classify(message) == first
+
+    def test_only_the_latest_message_is_cached(self) -> None:
+        """A new message replaces the cached decision instead of adding to it."""
+        router = SmartRouter()
+        message = "Please architect " + " ".join(["the"] * 20)
+        first = router.classify(message)
+        router.classify("Please plan " + " ".join(["the"] * 20))
+
+        assert router.classify(message) is not first
+        assert SmartRouter().classify(message) is not first
+
+    def test_subclass_overrides_are_honored(self) -> None:
+        """Keyword and length limits are read from the router's class."""
+
+        class StrictRouter(SmartRouter):
+            OPUS_KEYWORDS = ("refactor",)
+            SHORT_MESSAGE_WORDS = 3
+
+        result = StrictRouter().classify("Please refactor this module")
+        assert result.model == "opus"
+        assert result.reason == "heuristic:opus_keyword:refactor"
+
+    def test_fixed_outcomes_share_one_decision(self, router: SmartRouter) -> None:
+        """Different messages with the same fixed outcome share a decision object."""
+        assert router.classify("Hi") is router.classify("Hello there")
+        assert router.classify("```a```") is router.classify("```b```")
+
+    def test_opus_keyword_takes_precedence_over_code_block(self, router: SmartRouter) -> None:
+        """Messages with both opus keyword and code blocks test priority."""
         # Note: code_block is checked before opus keywords in the implementation
         message = """Please architect a solution:
 ```python
@@ -218,150 +241,191 @@ def example():
         assert result.reason == "heuristic:code_block"
 
 
-class TestSmartRouterClassifyWithHaiku:
-    """Tests for SmartRouter.classify_with_haiku() - Haiku classification layer."""
+def _haiku_reply(text: str, status_code: int = 200) -> MagicMock:
+    """Build a fake HTTP response carrying Haiku's one-word answer."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = {"content": [{"text": text}]}
+    return response
 
-    @pytest.mark.asyncio
-    async def test_classify_with_haiku_returns_opus_classification(self) -> None:
-        """Haiku classification returning OPUS routes to opus."""
-        from unittest.mock import AsyncMock, MagicMock, patch
 
-        router = SmartRouter()
+@pytest.fixture
+def mock_httpx_client(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    """Patch the router's HTTP client class and return the client it creates."""
+    client = AsyncMock()
+    monkeypatch.setattr("claudius.router.httpx.AsyncClient", MagicMock(return_value=client))
+    return client
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"content": [{"text": "OPUS"}]}
 
-        mock_client_instance = AsyncMock()
-        mock_client_instance.post.return_value = mock_response
+class TestSmartRouterClassifyWithHaiku:
+    """Tests for SmartRouter.classify_with_haiku() - Haiku classification layer."""
 
-        with patch("claudius.router.httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
-            mock_client.return_value.__aexit__.return_value = None
+    @pytest.mark.asyncio
+    async def test_classify_with_haiku_returns_opus_classification(
+        self, mock_httpx_client: AsyncMock
+    ) -> None:
+        """Haiku classification returning OPUS routes to opus."""
+        mock_httpx_client.post.return_value = _haiku_reply("OPUS")
 
-            result = await router.classify_with_haiku("test message", "fake-api-key")
+        result = await SmartRouter().classify_with_haiku("test message", "fake-api-key")
 
         assert result.model == "opus"
         assert result.reason == "haiku:classified_opus"
 
     @pytest.mark.asyncio
-    async def test_classify_with_haiku_returns_sonnet_classification(self) -> None:
+    async def test_classify_with_haiku_returns_sonnet_classification(
+        self, mock_httpx_client: AsyncMock
+    ) -> None:
         """Haiku classification returning SONNET routes to sonnet."""
-        from unittest.mock import AsyncMock, MagicMock, patch
+        mock_httpx_client.post.return_value = _haiku_reply("SONNET")
 
-        router = SmartRouter()
+        result = await SmartRouter().classify_with_haiku("test message", "fake-api-key")
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"content": [{"text": "SONNET"}]}
+        assert result.model == "sonnet"
+        assert result.reason == "haiku:classified_sonnet"
 
-        mock_client_instance = AsyncMock()
-        mock_client_instance.post.return_value = mock_response
+    @pytest.mark.asyncio
+    async def test_classify_with_haiku_returns_haiku_classification(
+        self, mock_httpx_client: AsyncMock
+    ) -> None:
+        """Haiku classification returning HAIKU means it can self-handle."""
+        mock_httpx_client.post.return_value = _haiku_reply("HAIKU")
 
-        with patch("claudius.router.httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
-            mock_client.return_value.__aexit__.return_value = None
+        result = await SmartRouter().classify_with_haiku("test message", "fake-api-key")
 
-            result = await router.classify_with_haiku("test message", "fake-api-key")
+        assert result.model == "haiku"
+        assert result.reason == "haiku:self_handle"
+
+    @pytest.mark.asyncio
+    async def test_classify_with_haiku_error_falls_back_to_sonnet(
+        self, mock_httpx_client: AsyncMock
+    ) -> None:
+        """API errors fall back to sonnet."""
+        mock_httpx_client.post.side_effect = Exception("API Error")
+
+        result = await SmartRouter().classify_with_haiku("test message", "fake-api-key")
 
         assert result.model == "sonnet"
-        assert result.reason == "haiku:classified_sonnet"
+        assert result.reason == "haiku:classification_error"
 
     @pytest.mark.asyncio
-    async def test_classify_with_haiku_returns_haiku_classification(self) -> None:
-        """Haiku classification returning HAIKU means it can self-handle."""
-        from unittest.mock import AsyncMock, MagicMock, patch
-
-        router = SmartRouter()
+    async def test_classify_with_haiku_non_200_falls_back_to_sonnet(
+        self, mock_httpx_client: AsyncMock
+    ) -> None:
+        """Non-200 status code falls back to sonnet."""
+        mock_httpx_client.post.return_value = _haiku_reply("", status_code=500)
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"content": [{"text": "HAIKU"}]}
+        result = await SmartRouter().classify_with_haiku("test message", "fake-api-key")
 
-        mock_client_instance = AsyncMock()
-        mock_client_instance.post.return_value = mock_response
+        assert result.model == "sonnet"
+        assert result.reason == "haiku:classification_error"
 
-        with patch("claudius.router.httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
-            mock_client.return_value.__aexit__.return_value = None
+    @pytest.mark.asyncio
+    async def test_classify_with_haiku_unknown_response_defaults_to_haiku(
+        self, mock_httpx_client: AsyncMock
+    ) -> None:
+        """Unknown classification response defaults to haiku (self-handle)."""
+        mock_httpx_client.post.return_value = _haiku_reply("UNKNOWN")
 
-            result = await router.classify_with_haiku("test message", "fake-api-key")
+        result = await SmartRouter().classify_with_haiku("test message", "fake-api-key")
 
         assert result.model == "haiku"
         assert result.reason == "haiku:self_handle"
 
     @pytest.mark.asyncio
-    async def test_classify_with_haiku_error_falls_back_to_sonnet(self) -> None:
-        """API errors fall back to sonnet."""
-        from unittest.mock import AsyncMock, patch
-
+    async def test_classify_with_haiku_reuses_http_client(self) -> None:
+        """Repeated classifications share one HTTP client until aclose()."""
         router = SmartRouter()
 
         mock_client_instance = AsyncMock()
-        mock_client_instance.post.side_effect = Exception("API Error")
+        mock_client_instance.post.return_value = _haiku_reply("SONNET")
 
         with patch("claudius.router.httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
-            mock_client.return_value.__aexit__.return_value = None
+            mock_client.return_value = mock_client_instance
 
-            result = await router.classify_with_haiku("test message", "fake-api-key")
+            await router.classify_with_haiku("first message", "fake-api-key")
+            await router.classify_with_haiku("second message", "fake-api-key")
+            assert mock_client.call_count == 1
+            assert mock_client_instance.post.await_count == 2
 
-        assert result.model == "sonnet"
-        assert result.reason == "haiku:classification_error"
+            await router.aclose()
+            mock_client_instance.aclose.assert_awaited_once()
 
-    @pytest.mark.asyncio
-    async def test_classify_with_haiku_non_200_falls_back_to_sonnet(self) -> None:
-        """Non-200 status code falls back to sonnet."""
-        from unittest.mock import AsyncMock, MagicMock, patch
+            await router.classify_with_haiku("third message", "fake-api-key")
+            assert mock_client.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_classification_cache_is_off_by_default(
+        self, mock_httpx_client: AsyncMock
+    ) -> None:
+        """Without caching, every classification calls the API."""
+        mock_httpx_client.post.return_value = _haiku_reply("OPUS")
         router = SmartRouter()
 
-        mock_response = MagicMock()
-        mock_response.status_code = 500
+        await router.classify_with_haiku("test message", "fake-api-key")
+        await router.classify_with_haiku("test message", "fake-api-key")
 
-        mock_client_instance = AsyncMock()
-        mock_client_instance.post.return_value = mock_response
+        assert mock_httpx_client.post.await_count == 2
 
-        with patch("claudius.router.httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
-            mock_client.return_value.__aexit__.return_value = None
+    @pytest.mark.asyncio
+    async def test_classification_cache_reuses_verdict_for_near_duplicates(
+        self, mock_httpx_client: AsyncMock
+    ) -> None:
+        """Cached verdicts are reused for messages differing in case or whitespace."""
+        mock_httpx_client.post.return_value = _haiku_reply("OPUS")
+        router = SmartRouter(cache_classifications=True)
 
-            result = await router.classify_with_haiku("test message", "fake-api-key")
+        first = await router.classify_with_haiku("Test  message", "fake-api-key")
+        second = await router.classify_with_haiku("test message\n", "fake-api-key")
 
-        assert result.model == "sonnet"
-        assert result.reason == "haiku:classification_error"
+        assert mock_httpx_client.post.await_count == 1
+        assert second is first
+        assert second.reason == "haiku:classified_opus"
 
     @pytest.mark.asyncio
-    async def test_classify_with_haiku_unknown_response_defaults_to_haiku(self) -> None:
-        """Unknown classification response defaults to haiku (self-handle)."""
-        from unittest.mock import AsyncMock, MagicMock, patch
+    async def test_classification_cache_skips_errors(
+        self, mock_httpx_client: AsyncMock
+    ) -> None:
+        """Fallback decisions from failed calls are not cached."""
+        mock_httpx_client.post.side_effect = Exception("API Error")
+        router = SmartRouter(cache_classifications=True)
 
-        router = SmartRouter()
+        await router.classify_with_haiku("test message", "fake-api-key")
+        await router.classify_with_haiku("test message", "fake-api-key")
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"content": [{"text": "UNKNOWN"}]}
+        assert mock_httpx_client.post.await_count == 2
 
-        mock_client_instance = AsyncMock()
-        mock_client_instance.post.return_value = mock_response
+    @pytest.mark.asyncio
+    async def test_classification_cache_evicts_oldest_when_full(
+        self, mock_httpx_client: AsyncMock
+    ) -> None:
+        """A full cache drops its oldest verdict to make room for a new one."""
+        mock_httpx_client.post.side_effect = [
+            _haiku_reply("OPUS"),
+            _haiku_reply("SONNET"),
+            _haiku_reply("OPUS"),
+        ]
+        router = SmartRouter(cache_classifications=True)
+        router.CLASSIFICATION_CACHE_SIZE = 1
 
-        with patch("claudius.router.httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
-            mock_client.return_value.__aexit__.return_value = None
+        await router.classify_with_haiku("first message", "fake-api-key")
+        second = await router.classify_with_haiku("second message", "fake-api-key")
+        assert router._classification_cache is not None
+        assert list(router._classification_cache.values()) == [second]
 
-            result = await router.classify_with_haiku("test message", "fake-api-key")
+        third = await router.classify_with_haiku("first message", "fake-api-key")
 
-        assert result.model == "haiku"
-        assert result.reason == "haiku:self_handle"
+        assert list(router._classification_cache.values()) == [third]
+        assert mock_httpx_client.post.await_count == 3
 
 
 class TestSmartRouterConstants:
     """Tests for SmartRouter class constants."""
 
-    def test_opus_keywords_list_exists(self) -> None:
-        """SmartRouter has OPUS_KEYWORDS list."""
+    def test_opus_keywords_tuple_exists(self) -> None:
+        """SmartRouter has an immutable OPUS_KEYWORDS tuple."""
         assert hasattr(SmartRouter, "OPUS_KEYWORDS")
-        assert isinstance(SmartRouter.OPUS_KEYWORDS, list)
+        assert isinstance(SmartRouter.OPUS_KEYWORDS, tuple)
         assert len(SmartRouter.OPUS_KEYWORDS) > 0
 
     def test_opus_keywords_contains_expected_keywords(self) -> None:
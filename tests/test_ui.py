@@ -3,13 +3,14 @@
 
 """Tests for Claudius UI components."""
 
-import tempfile
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 
 import pytest
-from rich.console import Console
+from rich.console import Console, RenderableType
 
-from claudius.budget import BudgetTracker
+from claudius.budget import MEMORY_DB_PATH, BudgetTracker
 from claudius.config import Config
 from claudius.ui import (
     get_color_for_percent,
@@ -22,223 +23,181 @@ from claudius.ui import (
     render_response,
     render_status,
 )
+from tests.helpers import BASE_CONFIG
 
+# Shared consoles; only their width and render options are used, nothing is written
+_CONSOLE_80 = Console(width=80)
+_CONSOLE_100 = Console(width=100)
 
-class TestRenderBanner:
-    """Tests for render_banner function."""
 
-    def test_banner_contains_claudius_ascii_art(self) -> None:
-        """Test that banner contains the CLAUDIUS ASCII art."""
-        result = render_banner()
-        # Render to string to check content
-        console = Console(force_terminal=True, width=80)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
+def _render(renderable: RenderableType, console: Console = _CONSOLE_100) -> str:
+    """Lay out a renderable and return its plain text.
 
-        # Should contain parts of the ASCII art
-        assert "CLAUDIUS" in output or "╔═╗" in output
+    Joins the rendered segments directly, so no ANSI style codes are generated.
+    """
+    return "".join(segment.text for segment in console.render(renderable))
 
-    def test_banner_contains_tagline(self) -> None:
-        """Test that banner contains the budget guardian tagline."""
-        result = render_banner()
-        console = Console(force_terminal=True, width=80)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
 
-        assert "Budget Guardian" in output
+def _assert_contains_any(output: str, *needles: str) -> None:
+    """Assert that at least one of the needles appears in the rendered output."""
+    assert any(needle in output for needle in needles), f"none of {needles!r} in output"
 
-    def test_banner_contains_version(self) -> None:
-        """Test that banner contains version information."""
-        result = render_banner()
-        console = Console(force_terminal=True, width=80)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
 
-        assert "v" in output  # Version should be present
+def _assert_contains_all(output: str, *needles: str) -> None:
+    """Assert that every needle appears in the rendered output."""
+    missing = [needle for needle in needles if needle not in output]
+    assert not missing, f"{missing!r} missing from output"
 
 
-class TestRenderBudgetBars:
-    """Tests for render_budget_bars function."""
+@pytest.fixture(scope="class")
+def tracker() -> Iterator[BudgetTracker]:
+    """Create one budget tracker per class; rendering tests only read from it."""
+    with BudgetTracker(db_path=MEMORY_DB_PATH) as tracker:
+        yield tracker
 
-    @pytest.fixture
-    def tracker(self) -> BudgetTracker:
-        """Create a budget tracker with temporary database."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-            return BudgetTracker(db_path=Path(f.name))
 
-    @pytest.fixture
-    def config(self) -> Config:
-        """Create a default config."""
-        return Config()
+@pytest.fixture(scope="class")
+def config() -> Config:
+    """Share the session's default config; rendering never mutates it."""
+    return BASE_CONFIG
 
-    def test_budget_bars_shows_monthly_budget(
-        self, tracker: BudgetTracker, config: Config
-    ) -> None:
-        """Test that budget bars show monthly budget information."""
-        result = render_budget_bars(tracker, config)
-        console = Console(force_terminal=True, width=100)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
 
-        assert "Monthly" in output
+@pytest.fixture(scope="class")
+def banner_output() -> str:
+    """Render the startup banner once; it does not depend on any state."""
+    return _render(render_banner(), _CONSOLE_80)
 
-    def test_budget_bars_shows_daily_budget(
-        self, tracker: BudgetTracker, config: Config
-    ) -> None:
-        """Test that budget bars show daily budget information."""
-        result = render_budget_bars(tracker, config)
-        console = Console(force_terminal=True, width=100)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
 
-        assert "Today" in output
+# Argument sets for render_budget_alert; each is rendered once by the alert fixture
+_ALERT_CASES: dict[str, dict[str, Any]] = {
+    "daily_82": {"alert_type": "daily", "percent": 82.0, "spent": 4.10, "budget": 5.00},
+    "monthly_85": {"alert_type": "monthly", "percent": 85.0, "spent": 76.50, "budget": 90.00},
+    "daily_80_usd": {
+        "alert_type": "daily",
+        "percent": 80.0,
+        "spent": 4.00,
+        "budget": 5.00,
+        "currency": "USD",
+    },
+    "daily_80": {"alert_type": "daily", "percent": 80.0, "spent": 4.00, "budget": 5.00},
+    "monthly_100": {"alert_type": "monthly", "percent": 100.0, "spent": 90.00, "budget": 90.00},
+    "monthly_110": {"alert_type": "monthly", "percent": 110.0, "spent": 99.00, "budget": 90.00},
+}
 
-    def test_budget_bars_uses_currency_from_config(
-        self, tracker: BudgetTracker
-    ) -> None:
-        """Test that budget bars use currency symbol from config."""
-        config = Config()
-        config.budget.currency = "USD"
 
-        result = render_budget_bars(tracker, config)
-        console = Console(force_terminal=True, width=100)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
+@pytest.fixture(scope="class", params=list(_ALERT_CASES))
+def alert(request: pytest.FixtureRequest) -> tuple[dict[str, Any], str]:
+    """Render a budget alert case once and share it with every test in the class."""
+    kwargs = {"currency": "EUR", **_ALERT_CASES[request.param]}
+    return kwargs, _render(render_budget_alert(**kwargs))
 
-        assert "$" in output
 
-    def test_budget_bars_eur_currency(self, tracker: BudgetTracker) -> None:
-        """Test that budget bars show EUR currency correctly."""
-        config = Config()
-        config.budget.currency = "EUR"
+@pytest.fixture(scope="class")
+def budget_bars_output(tracker: BudgetTracker, config: Config) -> str:
+    """Render the default budget bars once for every assertion in a class."""
+    return _render(render_budget_bars(tracker, config))
 
-        result = render_budget_bars(tracker, config)
-        console = Console(force_terminal=True, width=100)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
 
-        # EUR should show Euro symbol
-        assert "EUR" in output or "€" in output
+@pytest.fixture(scope="class")
+def status_output(tracker: BudgetTracker, config: Config) -> str:
+    """Render the default status panel once for every assertion in a class."""
+    return _render(render_status(tracker, config))
 
-    def test_budget_bars_green_under_50_percent(
-        self, tracker: BudgetTracker, config: Config
-    ) -> None:
-        """Test that budget bars are green when under 50%."""
-        # With no spending, should be at 0% which is green
-        result = render_budget_bars(tracker, config)
-        console = Console(force_terminal=True, width=100)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
-
-        # Progress bar should be displayed
-        assert "█" in output or "░" in output
-
-    def test_budget_bars_shows_rollover(
-        self, tracker: BudgetTracker, config: Config
-    ) -> None:
-        """Test that budget bars show rollover information."""
-        result = render_budget_bars(tracker, config)
-        console = Console(force_terminal=True, width=100)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
 
-        assert "Rollover" in output
+@pytest.fixture(scope="class")
+def cost_estimate_output() -> str:
+    """Render one Haiku cost estimate once for every assertion in a class."""
+    return _render(
+        render_cost_estimate(
+            input_cost=0.01,
+            output_cost_min=0.02,
+            output_cost_max=0.05,
+            model="haiku",
+            currency="EUR",
+        )
+    )
 
-    def test_budget_bars_shows_reset_days(
-        self, tracker: BudgetTracker, config: Config
-    ) -> None:
-        """Test that budget bars show days until reset."""
-        result = render_budget_bars(tracker, config)
-        console = Console(force_terminal=True, width=100)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
 
-        assert "Reset" in output or "days" in output
+@pytest.fixture(scope="class")
+def cost_line_output(tracker: BudgetTracker, config: Config) -> str:
+    """Render the default cost line once for every assertion in a class."""
+    return _render(render_cost_line(tracker, config))
 
 
-class TestRenderStatus:
-    """Tests for render_status function."""
+class TestRenderBanner:
+    """Tests for render_banner function."""
 
-    @pytest.fixture
-    def tracker(self) -> BudgetTracker:
-        """Create a budget tracker with temporary database."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-            return BudgetTracker(db_path=Path(f.name))
+    @pytest.mark.parametrize(
+        "needles",
+        [
+            pytest.param(("CLAUDIUS", "╔═╗"), id="ascii_art"),
+            pytest.param(("Budget Guardian",), id="tagline"),
+            pytest.param(("v",), id="version"),
+        ],
+    )
+    def test_banner_contains(self, banner_output: str, needles: tuple[str, ...]) -> None:
+        """Test that banner contains the ASCII art, tagline and version."""
+        _assert_contains_any(banner_output, *needles)
 
-    @pytest.fixture
-    def config(self) -> Config:
-        """Create a default config."""
-        return Config()
 
-    def test_status_shows_title(
-        self, tracker: BudgetTracker, config: Config
-    ) -> None:
-        """Test that status shows Budget Status title."""
-        result = render_status(tracker, config)
-        console = Console(force_terminal=True, width=100)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
+class TestRenderBudgetBars:
+    """Tests for render_budget_bars function."""
 
-        assert "Budget Status" in output
+    @pytest.mark.parametrize(
+        "needles",
+        [
+            pytest.param(("Monthly",), id="monthly_budget"),
+            pytest.param(("Today",), id="daily_budget"),
+            # With no spending the bars sit at 0%, which is green
+            pytest.param(("█", "░"), id="progress_bar"),
+            pytest.param(("Rollover",), id="rollover"),
+            pytest.param(("Reset", "days"), id="reset_days"),
+        ],
+    )
+    def test_budget_bars_show_section(
+        self, budget_bars_output: str, needles: tuple[str, ...]
+    ) -> None:
+        """Test that budget bars show each part of the budget summary."""
+        _assert_contains_any(budget_bars_output, *needles)
 
-    def test_status_shows_monthly_budget(
-        self, tracker: BudgetTracker, config: Config
+    def test_budget_bars_uses_currency_from_config(
+        self, tracker: BudgetTracker
     ) -> None:
-        """Test that status shows monthly budget details."""
-        result = render_status(tracker, config)
-        console = Console(force_terminal=True, width=100)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
+        """Test that budget bars use currency symbol from config."""
+        config = Config()
+        config.budget.currency = "USD"
 
-        assert "Monthly" in output
+        output = _render(render_budget_bars(tracker, config))
 
-    def test_status_shows_daily_budget(
-        self, tracker: BudgetTracker, config: Config
-    ) -> None:
-        """Test that status shows daily budget details."""
-        result = render_status(tracker, config)
-        console = Console(force_terminal=True, width=100)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
+        assert "$" in output
 
-        assert "Today" in output
+    def test_budget_bars_eur_currency(self, tracker: BudgetTracker) -> None:
+        """Test that budget bars show EUR currency correctly."""
+        config = Config()
+        config.budget.currency = "EUR"
 
-    def test_status_shows_rollover(
-        self, tracker: BudgetTracker, config: Config
-    ) -> None:
-        """Test that status shows rollover amount."""
-        result = render_status(tracker, config)
-        console = Console(force_terminal=True, width=100)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
+        output = _render(render_budget_bars(tracker, config))
 
-        assert "Rollover" in output
+        # EUR should show Euro symbol
+        _assert_contains_any(output, "EUR", "€")
 
-    def test_status_shows_reset_days(
-        self, tracker: BudgetTracker, config: Config
-    ) -> None:
-        """Test that status shows days until reset."""
-        result = render_status(tracker, config)
-        console = Console(force_terminal=True, width=100)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
 
-        assert "Reset" in output
+class TestRenderStatus:
+    """Tests for render_status function."""
+
+    @pytest.mark.parametrize(
+        "needles",
+        [
+            pytest.param(("Budget Status",), id="title"),
+            pytest.param(("Monthly",), id="monthly_budget"),
+            pytest.param(("Today",), id="daily_budget"),
+            pytest.param(("Rollover",), id="rollover"),
+            pytest.param(("Reset",), id="reset_days"),
+        ],
+    )
+    def test_status_shows_section(self, status_output: str, needles: tuple[str, ...]) -> None:
+        """Test that status shows each part of the budget details."""
+        _assert_contains_any(status_output, *needles)
 
     def test_status_uses_currency_from_config(
         self, tracker: BudgetTracker
@@ -247,11 +206,7 @@ class TestRenderStatus:
         config = Config()
         config.budget.currency = "USD"
 
-        result = render_status(tracker, config)
-        console = Console(force_terminal=True, width=100)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
+        output = _render(render_status(tracker, config))
 
         assert "$" in output
 
@@ -261,241 +216,96 @@ class TestRenderResponse:
 
     def test_response_shows_model_indicator(self) -> None:
         """Test that response shows model indicator."""
-        result = render_response("Haiku", "This is a test response.")
-        console = Console(force_terminal=True, width=100)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
+        output = _render(render_response("Haiku", "This is a test response."))
 
         assert "Haiku" in output
 
     def test_response_shows_text(self) -> None:
         """Test that response shows the response text."""
-        result = render_response("Sonnet", "This is a test response.")
-        console = Console(force_terminal=True, width=100)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
+        output = _render(render_response("Sonnet", "This is a test response."))
 
         assert "This is a test response." in output
 
-    def test_response_with_different_models(self) -> None:
+    @pytest.mark.parametrize("model", ["Haiku", "Sonnet", "Opus"])
+    def test_response_with_different_models(self, model: str) -> None:
         """Test that response works with different model names."""
-        for model in ["Haiku", "Sonnet", "Opus"]:
-            result = render_response(model, "Response text")
-            console = Console(force_terminal=True, width=100)
-            with console.capture() as capture:
-                console.print(result)
-            output = capture.get()
+        output = _render(render_response(model, "Response text"))
 
-            assert model in output
+        assert model in output
 
 
 class TestRenderCostEstimate:
     """Tests for render_cost_estimate function."""
 
-    def test_cost_estimate_shows_total_range(self) -> None:
-        """Test that cost estimate shows total cost range."""
-        result = render_cost_estimate(
-            input_cost=0.01,
-            output_cost_min=0.02,
-            output_cost_max=0.05,
-            model="haiku",
-            currency="EUR",
-        )
-        console = Console(force_terminal=True, width=100)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
-
-        # Total should be 0.03 - 0.06
-        assert "0.0300" in output
-        assert "0.0600" in output
-
-    def test_cost_estimate_shows_input_cost(self) -> None:
-        """Test that cost estimate shows input cost with (exact) label."""
-        result = render_cost_estimate(
-            input_cost=0.01,
-            output_cost_min=0.02,
-            output_cost_max=0.05,
-            model="sonnet",
-            currency="EUR",
-        )
-        console = Console(force_terminal=True, width=100)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
-
-        assert "Input" in output
-        assert "0.0100" in output
-        assert "(exact)" in output
-
-    def test_cost_estimate_shows_output_cost_range(self) -> None:
-        """Test that cost estimate shows output cost range with (est) label."""
-        result = render_cost_estimate(
-            input_cost=0.01,
-            output_cost_min=0.02,
-            output_cost_max=0.05,
-            model="opus",
-            currency="EUR",
-        )
-        console = Console(force_terminal=True, width=100)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
-
-        assert "Output" in output
-        assert "0.0200" in output
-        assert "0.0500" in output
-        assert "(est)" in output
-
-    def test_cost_estimate_shows_model_name(self) -> None:
-        """Test that cost estimate shows the model name."""
-        result = render_cost_estimate(
-            input_cost=0.01,
-            output_cost_min=0.02,
-            output_cost_max=0.05,
-            model="haiku",
-            currency="EUR",
-        )
-        console = Console(force_terminal=True, width=100)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
-
-        assert "Model" in output
-        assert "Haiku" in output  # Title case
+    @pytest.mark.parametrize(
+        "needles",
+        [
+            # Total should be 0.03 - 0.06
+            pytest.param(("0.0300", "0.0600"), id="total_range"),
+            pytest.param(("Input", "0.0100", "(exact)"), id="input_cost"),
+            pytest.param(("Output", "0.0200", "0.0500", "(est)"), id="output_cost_range"),
+            pytest.param(("Model", "Haiku"), id="model_name"),  # Title case
+            pytest.param(("Estimated cost",), id="estimated_cost_label"),
+        ],
+    )
+    def test_cost_estimate_shows_section(
+        self, cost_estimate_output: str, needles: tuple[str, ...]
+    ) -> None:
+        """Test that cost estimate shows each line with its figures and labels."""
+        _assert_contains_all(cost_estimate_output, *needles)
 
     def test_cost_estimate_uses_currency_symbol(self) -> None:
         """Test that cost estimate uses correct currency symbol."""
-        result = render_cost_estimate(
-            input_cost=0.01,
-            output_cost_min=0.02,
-            output_cost_max=0.05,
-            model="sonnet",
-            currency="USD",
+        output = _render(
+            render_cost_estimate(
+                input_cost=0.01,
+                output_cost_min=0.02,
+                output_cost_max=0.05,
+                model="sonnet",
+                currency="USD",
+            )
         )
-        console = Console(force_terminal=True, width=100)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
 
         assert "$" in output
 
-    def test_cost_estimate_eur_currency(self) -> None:
+    def test_cost_estimate_eur_currency(self, cost_estimate_output: str) -> None:
         """Test that cost estimate shows EUR correctly."""
-        result = render_cost_estimate(
-            input_cost=0.01,
-            output_cost_min=0.02,
-            output_cost_max=0.05,
-            model="sonnet",
-            currency="EUR",
-        )
-        console = Console(force_terminal=True, width=100)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
-
         # EUR should show Euro symbol
-        assert "EUR" in output or "\u20ac" in output
-
-    def test_cost_estimate_shows_estimated_cost_label(self) -> None:
-        """Test that cost estimate shows 'Estimated cost' label."""
-        result = render_cost_estimate(
-            input_cost=0.01,
-            output_cost_min=0.02,
-            output_cost_max=0.05,
-            model="haiku",
-            currency="EUR",
-        )
-        console = Console(force_terminal=True, width=100)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
-
-        assert "Estimated cost" in output
+        _assert_contains_any(cost_estimate_output, "EUR", "\u20ac")
 
-    def test_cost_estimate_with_different_models(self) -> None:
+    @pytest.mark.parametrize("model", ["haiku", "sonnet", "opus"])
+    def test_cost_estimate_with_different_models(self, model: str) -> None:
         """Test that cost estimate works with different model names."""
-        for model in ["haiku", "sonnet", "opus"]:
-            result = render_cost_estimate(
+        output = _render(
+            render_cost_estimate(
                 input_cost=0.01,
                 output_cost_min=0.02,
                 output_cost_max=0.05,
                 model=model,
                 currency="EUR",
             )
-            console = Console(force_terminal=True, width=100)
-            with console.capture() as capture:
-                console.print(result)
-            output = capture.get()
+        )
 
-            assert model.title() in output
+        assert model.title() in output
 
 
 class TestRenderCostLine:
     """Tests for render_cost_line function."""
 
-    @pytest.fixture
-    def tracker(self) -> BudgetTracker:
-        """Create a budget tracker with temporary database."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-            return BudgetTracker(db_path=Path(f.name))
-
-    @pytest.fixture
-    def config(self) -> Config:
-        """Create a default config."""
-        return Config()
-
-    def test_cost_line_shows_monthly_spent(
-        self, tracker: BudgetTracker, config: Config
-    ) -> None:
-        """Test that cost line shows monthly spent amount."""
-        result = render_cost_line(tracker, config)
-        console = Console(force_terminal=True, width=100)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
-
-        # Should show monthly budget info
-        assert "/" in output  # format: spent/budget
-
-    def test_cost_line_shows_progress_bar(
-        self, tracker: BudgetTracker, config: Config
-    ) -> None:
-        """Test that cost line shows progress bar."""
-        result = render_cost_line(tracker, config)
-        console = Console(force_terminal=True, width=100)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
-
-        # Should have progress bar characters
-        assert "█" in output or "░" in output
-
-    def test_cost_line_shows_percentage(
-        self, tracker: BudgetTracker, config: Config
-    ) -> None:
-        """Test that cost line shows percentage."""
-        result = render_cost_line(tracker, config)
-        console = Console(force_terminal=True, width=100)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
-
-        assert "%" in output
-
-    def test_cost_line_shows_daily_spend(
-        self, tracker: BudgetTracker, config: Config
+    @pytest.mark.parametrize(
+        "needles",
+        [
+            pytest.param(("/",), id="monthly_spent"),  # format: spent/budget
+            pytest.param(("█", "░"), id="progress_bar"),
+            pytest.param(("%",), id="percentage"),
+            pytest.param(("Today",), id="daily_spend"),
+        ],
+    )
+    def test_cost_line_shows_section(
+        self, cost_line_output: str, needles: tuple[str, ...]
     ) -> None:
-        """Test that cost line shows today's spending."""
-        result = render_cost_line(tracker, config)
-        console = Console(force_terminal=True, width=100)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
-
-        assert "Today" in output
+        """Test that cost line shows each part of the spending summary."""
+        _assert_contains_any(cost_line_output, *needles)
 
     def test_cost_line_uses_currency_from_config(
         self, tracker: BudgetTracker
@@ -504,11 +314,7 @@ class TestRenderCostLine:
         config = Config()
         config.budget.currency = "USD"
 
-        result = render_cost_line(tracker, config)
-        console = Console(force_terminal=True, width=100)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
+        output = _render(render_cost_line(tracker, config))
 
         assert "$" in output
 
@@ -516,62 +322,41 @@ class TestRenderCostLine:
 class TestColorThresholds:
     """Tests for color threshold logic (green < 50%, yellow 50-80%, red > 80%)."""
 
-    def test_green_at_zero_percent(self) -> None:
-        """Test that 0% budget usage is green."""
-        assert get_color_for_percent(0) == "green"
-
-    def test_green_at_49_percent(self) -> None:
-        """Test that 49% budget usage is green."""
-        assert get_color_for_percent(49) == "green"
-
-    def test_yellow_at_50_percent(self) -> None:
-        """Test that exactly 50% budget usage is yellow."""
-        assert get_color_for_percent(50) == "yellow"
-
-    def test_yellow_at_79_percent(self) -> None:
-        """Test that 79% budget usage is yellow."""
-        assert get_color_for_percent(79) == "yellow"
-
-    def test_red_at_80_percent(self) -> None:
-        """Test that exactly 80% budget usage is red."""
-        assert get_color_for_percent(80) == "red"
-
-    def test_red_at_100_percent(self) -> None:
-        """Test that 100% budget usage is red."""
-        assert get_color_for_percent(100) == "red"
-
-    def test_red_over_100_percent(self) -> None:
-        """Test that over 100% budget usage is still red."""
-        assert get_color_for_percent(120) == "red"
+    @pytest.mark.parametrize(
+        ("percent", "color"),
+        [
+            pytest.param(0, "green", id="green_at_0"),
+            pytest.param(49, "green", id="green_at_49"),
+            pytest.param(50, "yellow", id="yellow_at_50"),
+            pytest.param(79, "yellow", id="yellow_at_79"),
+            pytest.param(80, "red", id="red_at_80"),
+            pytest.param(100, "red", id="red_at_100"),
+            pytest.param(120, "red", id="red_over_100"),
+        ],
+    )
+    def test_color_for_percent(self, percent: float, color: str) -> None:
+        """Test that budget usage maps to the expected color at each threshold."""
+        assert get_color_for_percent(percent) == color
 
 
 class TestCurrencySymbols:
     """Tests for currency symbol mapping."""
 
-    def test_eur_symbol(self) -> None:
-        """Test EUR maps to Euro symbol."""
-        assert get_currency_symbol("EUR") == "€"
-
-    def test_usd_symbol(self) -> None:
-        """Test USD maps to dollar symbol."""
-        assert get_currency_symbol("USD") == "$"
-
-    def test_gbp_symbol(self) -> None:
-        """Test GBP maps to pound symbol."""
-        assert get_currency_symbol("GBP") == "£"
-
-    def test_jpy_symbol(self) -> None:
-        """Test JPY maps to yen symbol."""
-        assert get_currency_symbol("JPY") == "¥"
-
-    def test_unknown_currency_returns_code(self) -> None:
-        """Test unknown currency returns the currency code."""
-        assert get_currency_symbol("XYZ") == "XYZ"
-
-    def test_case_insensitive(self) -> None:
-        """Test currency lookup is case insensitive."""
-        assert get_currency_symbol("eur") == "€"
-        assert get_currency_symbol("Eur") == "€"
+    @pytest.mark.parametrize(
+        ("currency", "symbol"),
+        [
+            pytest.param("EUR", "€", id="eur"),
+            pytest.param("USD", "$", id="usd"),
+            pytest.param("GBP", "£", id="gbp"),
+            pytest.param("JPY", "¥", id="jpy"),
+            pytest.param("XYZ", "XYZ", id="unknown_returns_code"),
+            pytest.param("eur", "€", id="lowercase"),
+            pytest.param("Eur", "€", id="mixed_case"),
+        ],
+    )
+    def test_currency_symbol(self, currency: str, symbol: str) -> None:
+        """Test that currency codes map to symbols, case-insensitively."""
+        assert get_currency_symbol(currency) == symbol
 
 
 class TestBudgetBarsWithSpending:
@@ -585,269 +370,57 @@ class TestBudgetBarsWithSpending:
         config.budget.daily_soft = 10.0
         return config
 
-    def test_budget_bars_with_50_percent_spending(self) -> None:
-        """Test budget bars render correctly at 50% spending (yellow threshold)."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-            tracker = BudgetTracker(db_path=Path(f.name))
-            # Record spending to reach 50%
-            tracker.record_usage(
-                model="test-model",
-                input_tokens=100,
-                output_tokens=200,
-                cost=50.0,  # 50% of 100 monthly budget
-            )
-
-            config = Config()
-            config.budget.monthly = 100.0
-            config.budget.daily_soft = 10.0
-
-            result = render_budget_bars(tracker, config)
-            console = Console(force_terminal=True, width=100)
-            with console.capture() as capture:
-                console.print(result)
-            output = capture.get()
-
-            # Should show 50% in output
-            assert "50%" in output
-
-    def test_budget_bars_with_high_spending(self) -> None:
-        """Test budget bars render correctly at high spending (over 80%)."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-            tracker = BudgetTracker(db_path=Path(f.name))
-            # Record spending to reach 85%
-            tracker.record_usage(
-                model="test-model",
-                input_tokens=100,
-                output_tokens=200,
-                cost=85.0,  # 85% of 100 monthly budget
-            )
-
-            config = Config()
-            config.budget.monthly = 100.0
-            config.budget.daily_soft = 10.0
-
-            result = render_budget_bars(tracker, config)
-            console = Console(force_terminal=True, width=100)
-            with console.capture() as capture:
-                console.print(result)
-            output = capture.get()
+    @pytest.mark.parametrize(
+        ("cost", "needle"),
+        [
+            pytest.param(50.0, "50%", id="yellow_threshold"),
+            pytest.param(85.0, "85%", id="over_80_percent"),
+        ],
+    )
+    def test_budget_bars_show_spending(
+        self, tmp_path: Path, config: Config, cost: float, needle: str
+    ) -> None:
+        """Test that budget bars show the share of the 100 monthly budget spent."""
+        tracker = BudgetTracker(db_path=tmp_path / "budget.db")
+        tracker.record_usage(
+            model="test-model",
+            input_tokens=100,
+            output_tokens=200,
+            cost=cost,
+        )
 
-            # Should show 85% in output
-            assert "85%" in output
+        assert needle in _render(render_budget_bars(tracker, config))
 
 
 class TestRenderBudgetAlert:
     """Tests for render_budget_alert function."""
 
-    def test_daily_alert_shows_warning_emoji(self) -> None:
-        """Test that daily budget alert shows warning emoji."""
-        result = render_budget_alert(
-            alert_type="daily",
-            percent=82.0,
-            spent=4.10,
-            budget=5.00,
-            currency="EUR",
-        )
-        console = Console(force_terminal=True, width=100)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
-
-        # Should contain warning emoji or warning-like content
-        assert "\u26a0" in output or "Daily budget" in output
-
-    def test_daily_alert_shows_daily_budget_label(self) -> None:
-        """Test that daily budget alert shows 'Daily budget' label."""
-        result = render_budget_alert(
-            alert_type="daily",
-            percent=82.0,
-            spent=4.10,
-            budget=5.00,
-            currency="EUR",
-        )
-        console = Console(force_terminal=True, width=100)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
-
-        assert "Daily budget" in output
-
-    def test_daily_alert_shows_percentage(self) -> None:
-        """Test that daily budget alert shows the percentage."""
-        result = render_budget_alert(
-            alert_type="daily",
-            percent=82.0,
-            spent=4.10,
-            budget=5.00,
-            currency="EUR",
-        )
-        console = Console(force_terminal=True, width=100)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
-
-        assert "82%" in output
-
-    def test_daily_alert_shows_spent_and_budget(self) -> None:
-        """Test that daily budget alert shows spent and budget amounts."""
-        result = render_budget_alert(
-            alert_type="daily",
-            percent=82.0,
-            spent=4.10,
-            budget=5.00,
-            currency="EUR",
-        )
-        console = Console(force_terminal=True, width=100)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
-
-        assert "4.10" in output
-        assert "5.00" in output
-
-    def test_monthly_alert_shows_alert_emoji(self) -> None:
-        """Test that monthly budget alert shows alert emoji."""
-        result = render_budget_alert(
-            alert_type="monthly",
-            percent=85.0,
-            spent=76.50,
-            budget=90.00,
-            currency="EUR",
-        )
-        console = Console(force_terminal=True, width=100)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
-
-        # Should contain alert emoji or monthly budget content
-        assert "\U0001f6a8" in output or "Monthly budget" in output
-
-    def test_monthly_alert_shows_monthly_budget_label(self) -> None:
-        """Test that monthly budget alert shows 'Monthly budget' label."""
-        result = render_budget_alert(
-            alert_type="monthly",
-            percent=85.0,
-            spent=76.50,
-            budget=90.00,
-            currency="EUR",
-        )
-        console = Console(force_terminal=True, width=100)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
-
-        assert "Monthly budget" in output
-
-    def test_monthly_alert_shows_percentage(self) -> None:
-        """Test that monthly budget alert shows the percentage."""
-        result = render_budget_alert(
-            alert_type="monthly",
-            percent=85.0,
-            spent=76.50,
-            budget=90.00,
-            currency="EUR",
-        )
-        console = Console(force_terminal=True, width=100)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
-
-        assert "85%" in output
-
-    def test_monthly_alert_shows_spent_and_budget(self) -> None:
-        """Test that monthly budget alert shows spent and budget amounts."""
-        result = render_budget_alert(
-            alert_type="monthly",
-            percent=85.0,
-            spent=76.50,
-            budget=90.00,
-            currency="EUR",
-        )
-        console = Console(force_terminal=True, width=100)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
-
-        assert "76.50" in output
-        assert "90.00" in output
-
-    def test_alert_uses_currency_symbol(self) -> None:
-        """Test that budget alert uses correct currency symbol."""
-        result = render_budget_alert(
-            alert_type="daily",
-            percent=80.0,
-            spent=4.00,
-            budget=5.00,
-            currency="USD",
-        )
-        console = Console(force_terminal=True, width=100)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
-
-        assert "$" in output
-
-    def test_alert_uses_eur_currency_symbol(self) -> None:
-        """Test that budget alert uses EUR currency symbol."""
-        result = render_budget_alert(
-            alert_type="daily",
-            percent=80.0,
-            spent=4.00,
-            budget=5.00,
-            currency="EUR",
-        )
-        console = Console(force_terminal=True, width=100)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
-
-        # EUR should show Euro symbol
-        assert "EUR" in output or "\u20ac" in output
-
-    def test_alert_at_exactly_80_percent(self) -> None:
-        """Test that budget alert works at exactly 80% threshold."""
-        result = render_budget_alert(
-            alert_type="daily",
-            percent=80.0,
-            spent=4.00,
-            budget=5.00,
-            currency="EUR",
-        )
-        console = Console(force_terminal=True, width=100)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
-
-        assert "80%" in output
-
-    def test_alert_at_100_percent(self) -> None:
-        """Test that budget alert works at 100% threshold."""
-        result = render_budget_alert(
-            alert_type="monthly",
-            percent=100.0,
-            spent=90.00,
-            budget=90.00,
-            currency="EUR",
-        )
-        console = Console(force_terminal=True, width=100)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
-
-        assert "100%" in output
-
-    def test_alert_over_100_percent(self) -> None:
-        """Test that budget alert works when over 100%."""
-        result = render_budget_alert(
-            alert_type="monthly",
-            percent=110.0,
-            spent=99.00,
-            budget=90.00,
-            currency="EUR",
-        )
-        console = Console(force_terminal=True, width=100)
-        with console.capture() as capture:
-            console.print(result)
-        output = capture.get()
-
-        assert "110%" in output
+    def test_alert_shows_emoji_and_label(self, alert: tuple[dict[str, Any], str]) -> None:
+        """Test that daily alerts show a warning and monthly alerts an alarm."""
+        kwargs, output = alert
+        if kwargs["alert_type"] == "daily":
+            assert "\u26a0" in output
+            assert "Daily budget" in output
+        else:
+            assert "\U0001f6a8" in output
+            assert "Monthly budget" in output
+
+    def test_alert_shows_percentage(self, alert: tuple[dict[str, Any], str]) -> None:
+        """Test that alerts show the percentage, including at and over 100%."""
+        kwargs, output = alert
+        assert f"{kwargs['percent']:g}%" in output
+
+    def test_alert_shows_spent_and_budget(self, alert: tuple[dict[str, Any], str]) -> None:
+        """Test that alerts show spent and budget amounts."""
+        kwargs, output = alert
+        assert f"{kwargs['spent']:.2f}" in output
+        assert f"{kwargs['budget']:.2f}" in output
+
+    def test_alert_uses_currency_symbol(self, alert: tuple[dict[str, Any], str]) -> None:
+        """Test that alerts use the symbol for their currency."""
+        kwargs, output = alert
+        if kwargs["currency"] == "USD":
+            assert "$" in output
+        else:
+            # EUR should show Euro symbol
+            _assert_contains_any(output, "EUR", "\u20ac")